@@ -6,6 +6,7 @@ from sqlalchemy import pool
 from sqlalchemy.engine import Connection
 from sqlalchemy.ext.asyncio import async_engine_from_config
 
+import services.alembic_ops  # noqa: F401  registers search index operations
 from models import Base
 from settings import settings
 
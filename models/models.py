@@ -4,10 +4,9 @@ import uuid
 
 from sqlalchemy import ForeignKey, select
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from sqlalchemy_utils import create_materialized_view
 
 from models import Base
-from services.search_service import FuzzySearchService, MaterializedSearchService
+from services.search_service import FuzzySearchService, IncrementalSearchService, MaterializedSearchService
 
 
 class AuthorModel(Base, kw_only=True):
@@ -48,25 +47,35 @@ articles_search = FuzzySearchService(
 )
 
 
-full_search = MaterializedSearchService(
-    create_materialized_view(
-        'articles_search_view',
-        select(
-            #
-            # Author fields:
-            AuthorModel.username,
-            AuthorModel.first_name,
-            AuthorModel.last_name,
-            #
-            # Article fields:
-            ArticleModel.title,
-            ArticleModel.body,
-        ).join(
-            ArticleModel,
-            isouter=True,
-        ),
-        Base.metadata,
-    ),
+full_search_query = select(
+    #
+    # Author fields:
+    AuthorModel.username,
+    AuthorModel.first_name,
+    AuthorModel.last_name,
+    #
+    # Article fields:
+    ArticleModel.title,
+    ArticleModel.body,
+).join(
+    ArticleModel,
+    isouter=True,
+)
+
+
+full_search = MaterializedSearchService.from_select(
+    'articles_search_view',
+    full_search_query,
+    Base.metadata,
+    similarity_limit=0.01,
+    init_index=True,
+)
+
+
+incremental_full_search = IncrementalSearchService(
+    'articles_search_table',
+    full_search_query,
+    Base.metadata,
     similarity_limit=0.01,
     init_index=True,
 )
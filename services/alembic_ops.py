@@ -0,0 +1,66 @@
+"""
+Alembic operations for search indexes. Autogenerate renders functional indexes incorrectly, so search indexes are
+created by the index of search service itself, with expression and operator class DDL of `Index`:
+
+>>> import services.alembic_ops  # registers operations, imported at `migrations/env.py`
+>>> op.create_search_index(articles_search.index, concurrently=True)
+>>> op.drop_search_index(articles_search.index.name, concurrently=True)
+
+`concurrently`: Build or drop index without blocking table writes. Runs at alembic `autocommit_block`, as concurrent
+    index builds can not run inside a transaction block.
+"""
+from alembic.operations import MigrateOperation, Operations
+from sqlalchemy import Index, text
+from sqlalchemy.schema import CreateIndex, DDLElement
+
+from services.ddl import CreateIndexConcurrently, DropIndexConcurrently
+from services.indexes import index_name
+
+
+def _execute(operations: Operations, element: DDLElement) -> None:
+    # compiled by migration dialect, so offline (`--sql`) migrations render it as well
+    operations.execute(str(element.compile(dialect=operations.get_context().dialect)))
+
+
+@Operations.register_operation('create_search_index')
+class CreateSearchIndexOp(MigrateOperation):
+    def __init__(self, index: Index, *, concurrently: bool = False) -> None:
+        self.index = index
+        self.concurrently = concurrently
+
+    @classmethod
+    def create_search_index(cls, operations: Operations, index: Index, *, concurrently: bool = False) -> None:
+        return operations.invoke(cls(index, concurrently=concurrently))
+
+    def reverse(self) -> 'DropSearchIndexOp':
+        return DropSearchIndexOp(index_name(self.index), concurrently=self.concurrently)
+
+
+@Operations.register_operation('drop_search_index')
+class DropSearchIndexOp(MigrateOperation):
+    def __init__(self, name: str, *, concurrently: bool = False) -> None:
+        self.name = name
+        self.concurrently = concurrently
+
+    @classmethod
+    def drop_search_index(cls, operations: Operations, name: str, *, concurrently: bool = False) -> None:
+        return operations.invoke(cls(name, concurrently=concurrently))
+
+
+@Operations.implementation_for(CreateSearchIndexOp)
+def create_search_index(operations: Operations, operation: CreateSearchIndexOp) -> None:
+    if operation.concurrently:
+        with operations.get_context().autocommit_block():
+            _execute(operations, CreateIndexConcurrently(operation.index, if_not_exists=True))
+    else:
+        _execute(operations, CreateIndex(operation.index))
+
+
+@Operations.implementation_for(DropSearchIndexOp)
+def drop_search_index(operations: Operations, operation: DropSearchIndexOp) -> None:
+    if operation.concurrently:
+        with operations.get_context().autocommit_block():
+            _execute(operations, DropIndexConcurrently(operation.name))
+    else:
+        preparer = operations.get_context().dialect.identifier_preparer
+        operations.execute(text(f'DROP INDEX IF EXISTS {preparer.quote(operation.name)}'))
@@ -0,0 +1,100 @@
+from typing import Any, AsyncIterable, Iterable, Sequence
+
+from sqlalchemy import Index, Table, func, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.schema import CreateIndex, DropIndex
+
+from services.search_service import FuzzySearchService, MaterializedSearchService, invalidate_on_commit
+
+
+class BulkLoad:
+    """
+    Load rows by Postgres `COPY` instead of ORM inserts, then rebuild search indexes and views once.
+
+    ### Usage:
+
+    >>> async with BulkLoad(session, articles_search, full_search, maintenance_work_mem='1GB') as load:
+    ...     await load.copy(Author.__table__, authors_rows, columns=['id', 'username', 'first_name', 'last_name'])
+    ...     await load.copy(Article.__table__, articles_rows, columns=['id', 'title', 'body', 'author_id'])
+
+    On enter, trigram indexes of `services` on regular tables are dropped, so copied rows are not inserted into GIN
+    indexes one by one. On exit, indexes are created again at once with `maintenance_work_mem` set for transaction,
+    copied tables are analyzed, materialized views are refreshed and search caches are invalidated on commit.
+
+    Everything runs at session transaction: if loading fails, transaction rollback restores dropped indexes.
+    Without any `copy` call it simply rebuilds indexes and views (reindex).
+    """
+
+    def __init__(
+        self,
+        session: AsyncSession,
+        *services: FuzzySearchService,
+        maintenance_work_mem: str | None = '1GB',
+    ) -> None:
+        self.session = session
+        self.services = services
+        self.maintenance_work_mem = maintenance_work_mem
+        self.copied: dict[Table, int] = {}
+
+    @property
+    def indexes(self) -> list[Index]:
+        """
+        Indexes dropped for loading time. Materialized views indexes are kept, as refresh rewrites view at once.
+        """
+        return [
+            index
+            for service in self.services
+            if not isinstance(service, MaterializedSearchService)
+            for index in service.indexes
+        ]
+
+    async def __aenter__(self) -> 'BulkLoad':
+        await self.session.flush()
+        for index in self.indexes:
+            await self.session.execute(DropIndex(index, if_exists=True))
+        return self
+
+    async def __aexit__(self, exc_type, *exc_info) -> None:
+        if exc_type is not None:
+            return
+
+        if self.maintenance_work_mem:
+            await self.session.execute(select(func.set_config('maintenance_work_mem', self.maintenance_work_mem, True)))
+        for index in self.indexes:
+            await self.session.execute(CreateIndex(index))
+
+        preparer = self.session.bind.engine.dialect.identifier_preparer
+        for table in self.copied:
+            await self.session.execute(text(f'ANALYZE {preparer.format_table(table)}'))
+
+        for service in self.services:
+            if isinstance(service, MaterializedSearchService):
+                await service.refresh(self.session)
+            else:
+                invalidate_on_commit(self.session, service)
+
+    async def copy(
+        self,
+        table: Table,
+        records: Iterable[Sequence[Any]] | AsyncIterable[Sequence[Any]],
+        *,
+        columns: Sequence[str],
+    ) -> int:
+        """
+        Copy `records` (tuples of `columns` values) into `table` by `COPY ... FROM STDIN` of `asyncpg` connection.
+        Records are streamed, so iterables of any size could be loaded. Return amount of copied rows.
+        """
+        connection = await self.session.connection()
+        raw_connection = await connection.get_raw_connection()
+        driver_connection = raw_connection.driver_connection
+        if driver_connection is None:
+            raise ValueError('Connection is invalidated. ')
+        status = await driver_connection.copy_records_to_table(
+            table.name,
+            records=records,
+            columns=list(columns),
+            schema_name=table.schema,
+        )
+        copied = int(status.split()[-1])
+        self.copied[table] = self.copied.get(table, 0) + copied
+        return copied
@@ -0,0 +1,65 @@
+import time
+from collections import OrderedDict
+from typing import Any, Protocol
+
+
+class SearchCache(Protocol):
+    """
+    Search results cache backend. Keys are strings prefixed by service namespace (`'<namespace>:...'`), values are
+    lists of picklable result rows. So any key-value storage (Redis-compatible as well) could implement it.
+    """
+
+    async def get(self, key: str) -> Any | None:
+        ...
+
+    async def set(self, key: str, value: Any) -> None:
+        ...
+
+    async def invalidate(self, namespace: str) -> None:
+        """
+        Drop all values of service namespace.
+        """
+
+
+class InMemorySearchCache:
+    """
+    In-process search results cache with LRU eviction and TTL expiration.
+
+    `maxsize`: Max amount of cached values. Least recently used values are evicted first.
+    `ttl`: Seconds value is valid for.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 60.0) -> None:
+        if maxsize <= 0:
+            raise ValueError('Cache size must be positive. ')
+
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._values: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    async def get(self, key: str) -> Any | None:
+        try:
+            expires, value = self._values[key]
+        except KeyError:
+            return None
+
+        if expires < time.monotonic():
+            del self._values[key]
+            return None
+
+        self._values.move_to_end(key)
+        return value
+
+    async def set(self, key: str, value: Any) -> None:
+        self._values[key] = (time.monotonic() + self.ttl, value)
+        self._values.move_to_end(key)
+        while len(self._values) > self.maxsize:
+            self._values.popitem(last=False)
+
+    async def invalidate(self, namespace: str) -> None:
+        prefix = f'{namespace}:'
+        for key in [key for key in self._values if key.startswith(prefix)]:
+            del self._values[key]
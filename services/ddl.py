@@ -0,0 +1,177 @@
+"""
+Postgres DDL constructs used by search services.
+"""
+from typing import Any, Literal
+
+from sqlalchemy import Column, Index, Select, Table
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.schema import CreateIndex, DDLElement
+
+TriggerEvent = Literal['INSERT', 'UPDATE', 'DELETE']
+
+
+class CreateSyncFunction(DDLElement):
+    """
+    Create trigger function, which rewrites `search_table` rows affected by changes of source table rows.
+
+    Every search row belongs to the row of the first table in `selectable` (root). Trigger function collects root keys
+    of changed source rows before (from search table) and after (from `selectable`) the change, deletes search rows of
+    these roots and inserts them again from `selectable`.
+
+    Rewrites of the same root are serialized by transaction level advisory locks (taken in keys order, so concurrent
+    rewrites of several roots do not deadlock). Otherwise concurrent transaction could not see search rows inserted by
+    uncommitted one, and would insert rows of the root once again after its commit.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        search_table: Table,
+        selectable: Select,
+        *,
+        source_pk: Column,
+        source_key: Column,
+        root_key: Column,
+    ):
+        self.name = name
+        self.search_table = search_table
+        self.selectable = selectable
+        self.source_pk = source_pk
+        self.source_key = source_key
+        self.root_key = root_key
+
+
+@compiles(CreateSyncFunction)
+def compile_create_sync_function(element: CreateSyncFunction, compiler, **kw):
+    preparer = compiler.preparer
+    search_table = preparer.format_table(element.search_table)
+    source_rows = compiler.sql_compiler.process(element.selectable, literal_binds=True)
+    columns = ', '.join(preparer.quote(column.name) for column in element.selectable.selected_columns)
+    source_key = preparer.quote(element.source_key.name)
+    root_key = preparer.quote(element.root_key.name)
+    source_pk = preparer.quote(element.source_pk.name)
+    # lock keys of different search tables do not collide
+    lock_namespace = element.search_table.name.replace("'", "''")
+    return f'''CREATE OR REPLACE FUNCTION {preparer.quote(element.name)}() RETURNS trigger LANGUAGE plpgsql AS $$
+DECLARE
+    affected {compiler.dialect.type_compiler.process(element.root_key.type)}[] := '{{}}';
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        affected := affected || ARRAY(
+            SELECT {root_key} FROM {search_table}
+            WHERE {source_key} IN (SELECT {source_pk} FROM old_rows)
+        );
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        affected := affected || ARRAY(
+            SELECT source_rows.{root_key} FROM ({source_rows}) AS source_rows
+            WHERE source_rows.{source_key} IN (SELECT {source_pk} FROM new_rows)
+        );
+    END IF;
+    PERFORM pg_advisory_xact_lock(hashtextextended('{lock_namespace}:' || roots.root::text, 0))
+    FROM (SELECT DISTINCT unnest(affected) AS root) AS roots
+    ORDER BY roots.root;
+    DELETE FROM {search_table} WHERE {root_key} = ANY(affected);
+    INSERT INTO {search_table} ({columns})
+    SELECT {columns} FROM ({source_rows}) AS source_rows WHERE source_rows.{root_key} = ANY(affected);
+    RETURN NULL;
+END
+$$'''
+
+
+class CreateSyncTrigger(DDLElement):
+    """
+    Create statement level trigger on `source` table calling `function` with transition tables of changed rows.
+    """
+
+    def __init__(self, function: str, source: Table, event: TriggerEvent):
+        self.function = function
+        self.source = source
+        self.event = event
+
+
+@compiles(CreateSyncTrigger)
+def compile_create_sync_trigger(element: CreateSyncTrigger, compiler, **kw):
+    preparer = compiler.preparer
+    referencing = {
+        'INSERT': 'NEW TABLE AS new_rows',
+        'UPDATE': 'OLD TABLE AS old_rows NEW TABLE AS new_rows',
+        'DELETE': 'OLD TABLE AS old_rows',
+    }
+    return (
+        f'CREATE TRIGGER {preparer.quote(f"{element.function}__{element.event.lower()}")} '
+        f'AFTER {element.event} ON {preparer.format_table(element.source)} '
+        f'REFERENCING {referencing[element.event]} '
+        f'FOR EACH STATEMENT EXECUTE FUNCTION {preparer.quote(element.function)}()'
+    )
+
+
+class DropSyncFunction(DDLElement):
+    """
+    Drop trigger function with all its triggers.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+
+
+@compiles(DropSyncFunction)
+def compile_drop_sync_function(element: DropSyncFunction, compiler, **kw):
+    return f'DROP FUNCTION IF EXISTS {compiler.preparer.quote(element.name)}() CASCADE'
+
+
+class CreateIndexConcurrently(DDLElement):
+    """
+    Create `index` by `CREATE INDEX CONCURRENTLY`, optionally under another `name`. Concurrent build does not block
+    table writes, but it can not run inside a transaction block. Failed build leaves invalid index behind.
+    """
+
+    def __init__(self, index: Index, *, name: str | None = None, if_not_exists: bool = False):
+        self.index = index
+        self.name = name
+        self.if_not_exists = if_not_exists
+
+
+@compiles(CreateIndexConcurrently)
+def compile_create_index_concurrently(element: CreateIndexConcurrently, compiler, **kw):
+    index = element.index
+    # the same DDL as for index itself, so functional expressions and operator classes are rendered as usual. Index is
+    # copied, so shared index is not changed while compiled (even by concurrent compilations)
+    dialect_kw: dict[str, Any] = {**index.dialect_kwargs, 'postgresql_concurrently': True}
+    copy = Index(element.name or index.name, *index.expressions, unique=index.unique, **dialect_kw)
+    try:
+        return compiler.visit_create_index(CreateIndex(copy, if_not_exists=element.if_not_exists), **kw)
+    finally:
+        # copy is attached to table of its columns
+        if copy.table is not None:
+            copy.table.indexes.discard(copy)
+
+
+class DropIndexConcurrently(DDLElement):
+    """
+    Drop index by `DROP INDEX CONCURRENTLY`, which does not block table reads and writes.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+
+
+@compiles(DropIndexConcurrently)
+def compile_drop_index_concurrently(element: DropIndexConcurrently, compiler, **kw):
+    return f'DROP INDEX CONCURRENTLY IF EXISTS {compiler.preparer.quote(element.name)}'
+
+
+class RenameIndex(DDLElement):
+    """
+    Rename index. Since Postgres 12 it does not block table reads and writes.
+    """
+
+    def __init__(self, name: str, new_name: str):
+        self.name = name
+        self.new_name = new_name
+
+
+@compiles(RenameIndex)
+def compile_rename_index(element: RenameIndex, compiler, **kw):
+    preparer = compiler.preparer
+    return f'ALTER INDEX {preparer.quote(element.name)} RENAME TO {preparer.quote(element.new_name)}'
@@ -0,0 +1,92 @@
+from contextlib import aclosing
+from typing import Any, AsyncGenerator, Sequence
+
+from sqlalchemy import Executable, Row
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
+
+from services.search_service import FuzzySearchService
+from settings import Settings
+
+
+def create_search_engine(settings: Settings) -> AsyncEngine:
+    """
+    Engine of search traffic: read replica (`SEARCH_POSTGRES_HOST`) with its own pool, so heavy trigram scans do not
+    take connections of primary engine. Every connection is set up with `statement_timeout`, `work_mem` for sorting
+    trigram candidates in memory and read only transactions by default.
+    """
+    return create_async_engine(
+        settings.SEARCH_DATABASE_URL,
+        pool_size=settings.SEARCH_POOL_SIZE,
+        max_overflow=settings.SEARCH_MAX_OVERFLOW,
+        pool_pre_ping=True,
+        echo=settings.SQL_LOGS,
+        echo_pool=settings.SQL_POOL_LOGS,
+        connect_args={
+            'server_settings': {
+                'statement_timeout': str(settings.SEARCH_STATEMENT_TIMEOUT),
+                'work_mem': settings.SEARCH_WORK_MEM,
+                'default_transaction_read_only': 'on',
+            },
+        },
+    )
+
+
+class SearchExecutor:
+    """
+    Run search reads of any services (`FuzzySearchService`, `MaterializedSearchService`, ...) on search engine.
+    Every call runs at its own read only transaction.
+
+    ### Usage:
+
+    >>> executor = SearchExecutor(create_search_engine(settings))
+    >>> rows = await executor.fetch(articles_search, 'some term we want to find', limit=20)
+    >>> rows = await executor.execute(full_search, full_search('some term we want to find', limit=20))
+
+    Writes and `MaterializedSearchService.refresh` stay on primary engine sessions: replica is refreshed by
+    replication. Search engine connections reject writes by `default_transaction_read_only`.
+    """
+
+    def __init__(self, engine: AsyncEngine) -> None:
+        self.engine = engine
+        self.sessionmaker = async_sessionmaker(engine, expire_on_commit=False)
+
+    async def execute(
+        self, service: FuzzySearchService, statement: Executable, parameters: dict[str, Any] | None = None
+    ) -> list[Row]:
+        """
+        Execute search `statement` of `service` (see `FuzzySearchService.__call__`) with similarity limits of service.
+        """
+        async with self.sessionmaker() as session, session.begin():
+            await service.set_similarity_limit(session)
+            return list((await session.execute(statement, parameters)).all())
+
+    async def fetch(self, service: FuzzySearchService, term: str, **kwargs: Any) -> list[Row]:
+        """
+        Search `term` by `service.fetch`, see its params. Takes two round trips: similarity limits are set at every new
+        transaction (see `FuzzySearchService.set_similarity_limit`).
+        """
+        async with self.sessionmaker() as session, session.begin():
+            return await service.fetch(session, term, **kwargs)
+
+    async def search_many(
+        self, service: FuzzySearchService, terms: Sequence[str], **kwargs: Any
+    ) -> dict[str, list[Row]]:
+        """
+        Search `terms` by `service.search_many`, see its params.
+        """
+        async with self.sessionmaker() as session, session.begin():
+            return await service.search_many(session, terms, **kwargs)
+
+    async def stream(
+        self, service: FuzzySearchService, term: str, **kwargs: Any
+    ) -> AsyncGenerator[Sequence[Row], None]:
+        """
+        Search `term` by `service.stream`, see its params. Transaction is kept open while iterating.
+        """
+        async with self.sessionmaker() as session, session.begin():
+            async with aclosing(service.stream(session, term, **kwargs)) as chunks:
+                async for chunk in chunks:
+                    yield chunk
+
+    async def dispose(self) -> None:
+        await self.engine.dispose()
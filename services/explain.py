@@ -0,0 +1,26 @@
+from sqlalchemy import Select
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.expression import ClauseElement, Executable
+
+
+class explain(Executable, ClauseElement):  # noqa N801
+    """
+    Get Postgres query plan for debug and test porpoises.
+    Docs: https://github.com/sqlalchemy/sqlalchemy/wiki/Query-Plan-SQL-construct
+    """
+
+    inherit_cache = True
+
+    def __init__(self, statement: Select, analyze: bool = False):
+        self.statement = statement
+        self.analyze = analyze
+
+
+@compiles(explain, "postgresql")
+def pg_explain(element, compiler, **kw):
+    text = "EXPLAIN "
+    if element.analyze:
+        text += "ANALYZE "
+    text += compiler.process(element.statement, **kw)
+
+    return text
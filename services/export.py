@@ -0,0 +1,41 @@
+"""
+Writers of streamed search results. See `FuzzySearchService.stream`.
+"""
+import csv
+import json
+from typing import AsyncIterable, Sequence, TextIO
+
+from sqlalchemy import Row
+
+
+async def write_csv(chunks: AsyncIterable[Sequence[Row]], file: TextIO, *, header: bool = True) -> int:
+    """
+    Write rows to CSV `file` chunk by chunk. Header is taken from the columns of the first row.
+    Return amount of written rows.
+
+    >>> with open('export.csv', 'w', newline='') as file:
+    ...     await write_csv(search.stream(session, 'some term we want to find'), file)
+    """
+    writer = csv.writer(file)
+    written = 0
+    async for chunk in chunks:
+        if header and not written and chunk:
+            writer.writerow(chunk[0]._fields)
+        writer.writerows(chunk)
+        written += len(chunk)
+    return written
+
+
+async def write_jsonl(chunks: AsyncIterable[Sequence[Row]], file: TextIO) -> int:
+    """
+    Write rows to JSON Lines `file` chunk by chunk: one JSON object by columns names for every row. Values which are
+    not JSON serializable (UUID, datetime, etc.) are written as strings. Return amount of written rows.
+
+    >>> with open('export.jsonl', 'w') as file:
+    ...     await write_jsonl(search.stream(session, 'some term we want to find'), file)
+    """
+    written = 0
+    async for chunk in chunks:
+        file.writelines(json.dumps(row._asdict(), default=str) + '\n' for row in chunk)
+        written += len(chunk)
+    return written
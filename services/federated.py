@@ -0,0 +1,128 @@
+import asyncio
+import copy
+import heapq
+import logging
+from typing import NamedTuple, Sequence
+
+from sqlalchemy import Row
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+from services.search_service import FuzzySearchService, SearchMode
+
+logger = logging.getLogger(__name__)
+
+
+class Shard(NamedTuple):
+    """
+    Search `service` on database of `engine`. Shards could share engine (partitions of one database) or service
+    (the same table at several databases).
+    """
+
+    name: str
+    engine: AsyncEngine
+    service: FuzzySearchService
+
+
+class ShardMatch(NamedTuple):
+    """
+    Matched `row` of `shard` with its similarity ratio.
+    """
+
+    shard: str
+    similarity_ratio: float
+    row: Row
+
+
+class FederatedResult(NamedTuple):
+    """
+    Merged top matches of every responded shard and errors of failed ones (`TimeoutError` for timed out shards).
+    """
+
+    matches: list[ShardMatch]
+    failed: dict[str, BaseException]
+
+    @property
+    def partial(self) -> bool:
+        return bool(self.failed)
+
+
+def _uncached(service: FuzzySearchService) -> FuzzySearchService:
+    if service.cache is None:
+        return service
+    # shallow copy shares built statements with original service
+    service = copy.copy(service)
+    service.cache = None
+    return service
+
+
+class FederatedSearchService:
+    """
+    Search one term at many shards (tables partitions or Postgres instances) concurrently and merge their top matches
+    by similarity ratio.
+
+    ### Usage:
+
+    >>> search = FederatedSearchService(
+    ...     [Shard('eu', eu_engine, articles_search), Shard('us', us_engine, articles_search)],
+    ...     timeout=0.5,
+    ... )
+    >>> result = await search.search('some term we want to find', limit=20)
+    >>> if result.partial:
+    ...     ...  # some shards failed or timed out, `result.failed` tells which ones
+
+    Every shard selects its own top `limit` matches by `service.fetch` (so instrumentation and term policy apply) at
+    its own session. Service cache is bypassed: cache keys do not tell databases apart, so a service shared by shards
+    would return rows of the first searched shard for all of them. Shards are not waited longer than `timeout`
+    seconds, so latency is bound by the slowest healthy shard, not by the sum of shards. Failed shards are reported
+    along with matches of the others.
+    Similarity limits of shard services should be the same, otherwise merged ratios are not comparable.
+    """
+
+    def __init__(self, shards: Sequence[Shard], *, timeout: float | None = 1.0) -> None:
+        if not shards:
+            raise ValueError('No shards. ')
+        if len({shard.name for shard in shards}) != len(shards):
+            raise ValueError('Shard names must be unique. ')
+        if timeout is not None and timeout <= 0:
+            raise ValueError('Timeout must be positive. ')
+
+        self.shards = tuple(shard._replace(service=_uncached(shard.service)) for shard in shards)
+        self.timeout = timeout
+
+    async def _search_shard(
+        self, shard: Shard, term: str, *, limit: int, knn: bool, mode: SearchMode | None
+    ) -> list[Row]:
+        async with AsyncSession(shard.engine) as session, session.begin():
+            return await shard.service.fetch(session, term, limit=limit, knn=knn, mode=mode)
+
+    async def search(
+        self,
+        term: str,
+        *,
+        limit: int = 10,
+        knn: bool = False,
+        mode: SearchMode | None = None,
+    ) -> FederatedResult:
+        """
+        Search `term` at every shard and return top `limit` matches of all shards.
+        """
+        results = await asyncio.gather(
+            *(
+                asyncio.wait_for(self._search_shard(shard, term, limit=limit, knn=knn, mode=mode), self.timeout)
+                for shard in self.shards
+            ),
+            return_exceptions=True,
+        )
+
+        matches: list[ShardMatch] = []
+        failed: dict[str, BaseException] = {}
+        for shard, result in zip(self.shards, results):
+            if isinstance(result, asyncio.CancelledError):
+                raise result
+            if isinstance(result, BaseException):
+                logger.warning(f'Search at shard {shard.name} failed: {result!r}. ')
+                failed[shard.name] = result
+                continue
+            matches.extend(ShardMatch(shard.name, row.similarity_ratio, row) for row in result)
+
+        return FederatedResult(heapq.nlargest(limit, matches, key=lambda match: match.similarity_ratio), failed)
@@ -0,0 +1,81 @@
+"""
+Online search indexes lifecycle: concurrent creation, rebuild with swap and validity checks.
+
+Concurrent index builds can not run inside a transaction block, so every operation takes `AsyncEngine` and runs on
+autocommit connection.
+"""
+from typing import Sequence
+
+from sqlalchemy import Index, text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+
+from services.ddl import CreateIndexConcurrently, DropIndexConcurrently, RenameIndex
+
+# Postgres identifiers length limit
+MAX_NAME_LENGTH = 63
+
+
+def index_name(index: Index) -> str:
+    """
+    Name of search `index`. Search indexes are always named: explicitly or by naming convention of metadata.
+    """
+    if index.name is None:
+        raise ValueError('Index has no name. ')
+    return str(index.name)
+
+
+async def index_validity(connection: AsyncConnection, names: Sequence[str]) -> dict[str, bool]:
+    """
+    Existing indexes of `names` by whether they are valid. Failed concurrent build leaves invalid index, which is not
+    used by queries, but still maintained on writes.
+    """
+    result = await connection.execute(
+        text(
+            'SELECT class.relname, index.indisvalid FROM pg_index AS index '
+            'JOIN pg_class AS class ON class.oid = index.indexrelid '
+            'WHERE class.relname = ANY(:names)'
+        ),
+        {'names': list(names)},
+    )
+    return {name: valid for name, valid in result}
+
+
+async def _autocommit(engine: AsyncEngine):
+    connection = await engine.connect()
+    return await connection.execution_options(isolation_level='AUTOCOMMIT')
+
+
+async def create_index(engine: AsyncEngine, index: Index) -> None:
+    """
+    Create `index` without blocking table writes. Invalid index left by failed build is dropped and built again.
+    Valid existing index is kept.
+    """
+    name = index_name(index)
+    connection = await _autocommit(engine)
+    async with connection:
+        validity = await index_validity(connection, [name])
+        if validity.get(name) is False:
+            await connection.execute(DropIndexConcurrently(name))
+        await connection.execute(CreateIndexConcurrently(index, if_not_exists=True))
+
+
+async def rebuild_index(engine: AsyncEngine, index: Index) -> None:
+    """
+    Build `index` again without blocking table reads and writes: new index is built concurrently under temporary
+    name, then it replaces the old one (if any). Useful for changing search columns or operator classes, as new
+    index is built by the current `index` definition.
+    """
+    name = index_name(index)
+    temporary = f'{name}__rebuild'[:MAX_NAME_LENGTH]
+    connection = await _autocommit(engine)
+    async with connection:
+        await connection.execute(DropIndexConcurrently(temporary))  # left by failed rebuild
+        try:
+            await connection.execute(CreateIndexConcurrently(index, name=temporary))
+        except Exception:
+            await connection.execute(DropIndexConcurrently(temporary))
+            raise
+
+        # old index keeps serving queries until the new one is valid, and the new one serves them after swap
+        await connection.execute(DropIndexConcurrently(name))
+        await connection.execute(RenameIndex(temporary, name))
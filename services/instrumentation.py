@@ -0,0 +1,126 @@
+import contextlib
+import inspect
+import random
+import time
+from typing import Any, Awaitable, Callable, NamedTuple
+
+from sqlalchemy import Row, Select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from services.explain import explain
+
+
+class SearchMetrics(NamedTuple):
+    """
+    Measurements of single search execution.
+
+    `service`: Search service cache namespace: searched table and columns.
+    `term_length`: Term length bucket, see `term_length_bucket`.
+    `terms`: Amount of searched terms. More than one for batch search.
+    `duration`: Seconds of query execution, including rows fetching.
+    `plan`: `EXPLAIN ANALYZE` output for sampled queries.
+    """
+
+    service: str
+    mode: str
+    threshold: float
+    term_length: str
+    terms: int
+    rows: int
+    duration: float
+    plan: str | None = None
+
+
+def term_length_bucket(term: str) -> str:
+    """
+    Power of two bucket of term length: `'1-3'`, `'4-7'`, `'8-15'`, `'16-31'`, `'32+'`.
+    Terms shorter than 4 characters produce too few trigrams for selective index scan.
+    """
+    for lower, upper in ((1, 3), (4, 7), (8, 15), (16, 31)):
+        if len(term) <= upper:
+            return f'{lower}-{upper}'
+    return '32+'
+
+
+class SearchInstrumentation:
+    """
+    Measure search executions of services (`fetch` and `search_many`) and pass `SearchMetrics` to `callback`.
+
+    >>> instrumentation = SearchInstrumentation(metrics.append, explain_sample_rate=0.01, slow_query=0.1)
+    >>> search = FuzzySearchService(Article.title, Article.body, instrumentation=instrumentation)
+
+    `callback`: Function (or coroutine function) receiving `SearchMetrics`.
+    `explain_sample_rate`: Fraction of queries re-run by `EXPLAIN ANALYZE` for capturing their plans (`plan` metric).
+        It shows whether trigram index is bypassed or index recheck removes too many rows.
+    `slow_query`: Seconds. If set, only queries running longer are sampled for `EXPLAIN ANALYZE`.
+    `tracer`: OpenTelemetry-compatible tracer. If set, every search is executed in `'search'` span with metrics
+        attributes: `tracer.start_as_current_span(name, attributes=...)`.
+    """
+
+    def __init__(
+        self,
+        callback: Callable[[SearchMetrics], Awaitable[None] | None],
+        *,
+        explain_sample_rate: float = 0.0,
+        slow_query: float | None = None,
+        tracer: Any = None,
+    ) -> None:
+        if not 0 <= explain_sample_rate <= 1:
+            raise ValueError('Explain sample rate must be in [0, 1] range. ')
+
+        self.callback = callback
+        self.explain_sample_rate = explain_sample_rate
+        self.slow_query = slow_query
+        self.tracer = tracer
+
+    def _span(self, attributes: dict[str, Any]):
+        if self.tracer is None:
+            return contextlib.nullcontext()
+        return self.tracer.start_as_current_span('search', attributes=attributes)
+
+    def _sampled(self, duration: float) -> bool:
+        if self.slow_query is not None and duration < self.slow_query:
+            return False
+        return random.random() < self.explain_sample_rate
+
+    async def execute(
+        self,
+        session: AsyncSession,
+        statement: Select,
+        parameters: dict[str, Any],
+        *,
+        service: str,
+        mode: str,
+        threshold: float,
+        terms: list[str],
+    ) -> list[Row]:
+        """
+        Execute search `statement` and record its metrics.
+        """
+        metrics = SearchMetrics(
+            service=service,
+            mode=mode,
+            threshold=threshold,
+            term_length=term_length_bucket(max(terms, key=len, default='')),
+            terms=len(terms),
+            rows=0,
+            duration=0.0,
+        )
+        attributes = {
+            f'search.{name}': getattr(metrics, name) for name in ('service', 'mode', 'threshold', 'term_length')
+        }
+        with self._span(attributes) as span:
+            started = time.perf_counter()
+            rows = (await session.execute(statement, parameters)).all()
+            metrics = metrics._replace(rows=len(rows), duration=time.perf_counter() - started)
+            if span is not None:
+                span.set_attribute('search.rows', metrics.rows)
+
+        if self.explain_sample_rate and self._sampled(metrics.duration):
+            plan = (await session.execute(explain(statement, analyze=True), parameters)).scalars()
+            metrics = metrics._replace(plan='\n'.join(plan))
+
+        result = self.callback(metrics)
+        if inspect.isawaitable(result):
+            await result
+        return list(rows)
@@ -0,0 +1,173 @@
+import asyncio
+import logging
+import time
+from typing import Any
+
+from sqlalchemy import Table, event
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+from sqlalchemy.orm import Session, SessionTransaction
+
+from services.search_service import MaterializedSearchService
+
+logger = logging.getLogger(__name__)
+
+
+class BackgroundRefresher:
+    """
+    Refresh materialized view of `MaterializedSearchService` in background, coalescing refresh requests.
+
+    ### Usage:
+
+    >>> refresher = BackgroundRefresher(full_search_service, engine, debounce=1, max_staleness=10)
+    >>> async with refresher:  # or `await refresher.start()` ... `await refresher.stop()`
+    ...     ...
+
+    View is marked dirty on every commit of session which flushed changes of view depending tables (`service.sources`,
+    or any tables if they are unknown). Refresh starts when no more changes come for `debounce` seconds, but not later
+    than `max_staleness` seconds after the first unrefreshed change. So N bursty commits cause only one refresh and
+    search results are stale for bounded time.
+
+    `concurrently`: Refresh without locking out concurrent selects. Requires unique index on view (see `from_select`),
+        pass `False` for views without it.
+    `staleness`: Seconds since the first change which is not refreshed yet. Zero for up to date view.
+    """
+
+    def __init__(
+        self,
+        service: MaterializedSearchService,
+        engine: AsyncEngine,
+        *,
+        debounce: float = 1.0,
+        max_staleness: float = 10.0,
+        concurrently: bool = True,
+        session_target: Any = Session,
+    ) -> None:
+        if debounce > max_staleness:
+            raise ValueError('Debounce must not exceed max staleness. ')
+        if concurrently and not service.key_index:
+            raise ValueError('Concurrent refresh requires unique index on view. Use `from_select` for view creation. ')
+
+        self.service = service
+        self.engine = engine
+        self.debounce = debounce
+        self.max_staleness = max_staleness
+        self.concurrently = concurrently
+        self.session_target = session_target
+
+        self.refresh_count = 0
+        self.last_refresh_duration: float | None = None
+
+        self._first_change: float | None = None
+        self._last_change: float | None = None
+        self._refreshing = False
+        self._first_change_while_refreshing: float | None = None
+        self._dirty: asyncio.Event | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._task: asyncio.Task | None = None
+
+    @property
+    def staleness(self) -> float:
+        if self._first_change is None:
+            return 0.0
+        return time.monotonic() - self._first_change
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def mark_dirty(self) -> None:
+        """
+        Request view refresh. Safe to call from any thread.
+        """
+        now = time.monotonic()
+        if self._refreshing:
+            # might be not included in current refresh
+            if self._first_change_while_refreshing is None:
+                self._first_change_while_refreshing = now
+        elif self._first_change is None:
+            self._first_change = now
+        self._last_change = now
+        if self._loop is not None and self._dirty is not None:
+            self._loop.call_soon_threadsafe(self._dirty.set)
+
+    async def start(self) -> None:
+        if self.running:
+            return
+        self._loop = asyncio.get_running_loop()
+        self._dirty = asyncio.Event()
+        if self._first_change is not None:
+            self._dirty.set()
+        event.listen(self.session_target, 'after_flush', self._after_flush)
+        event.listen(self.session_target, 'after_commit', self._after_commit)
+        event.listen(self.session_target, 'after_transaction_end', self._after_transaction_end)
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        event.remove(self.session_target, 'after_flush', self._after_flush)
+        event.remove(self.session_target, 'after_commit', self._after_commit)
+        event.remove(self.session_target, 'after_transaction_end', self._after_transaction_end)
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def __aenter__(self) -> 'BackgroundRefresher':
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.stop()
+
+    def _depends_on(self, table: Table | None) -> bool:
+        return not self.service.sources or table in self.service.sources
+
+    def _after_flush(self, session: Session, flush_context) -> None:
+        for instance in (*session.new, *session.dirty, *session.deleted):
+            if self._depends_on(getattr(instance, '__table__', None)):
+                session.info[self] = True
+                return
+
+    def _after_commit(self, session: Session) -> None:
+        if session.info.pop(self, False):
+            self.mark_dirty()
+
+    def _after_transaction_end(self, session: Session, transaction: SessionTransaction) -> None:
+        if transaction.parent is None:  # rolled back, as it is popped on commit already
+            session.info.pop(self, None)
+
+    async def _run(self) -> None:
+        assert self._dirty is not None
+        while True:
+            await self._dirty.wait()
+
+            # wait for changes to settle down, but no longer than staleness limit allows
+            while True:
+                assert self._first_change is not None and self._last_change is not None
+                deadline = min(self._last_change + self.debounce, self._first_change + self.max_staleness)
+                delay = deadline - time.monotonic()
+                if delay <= 0:
+                    break
+                await asyncio.sleep(delay)
+
+            # changes committed from that moment on are requested by new refresh
+            self._dirty.clear()
+            self._refreshing = True
+
+            started = time.monotonic()
+            try:
+                async with AsyncSession(self.engine) as session, session.begin():
+                    await self.service.refresh(session, concurrently=self.concurrently)
+            except Exception:
+                logger.exception(f'Failed to refresh {self.service.view.name}. Retry in {self.debounce} seconds. ')
+                self._dirty.set()
+                await asyncio.sleep(self.debounce)
+            else:
+                self._first_change = self._first_change_while_refreshing
+                self.refresh_count += 1
+                self.last_refresh_duration = time.monotonic() - started
+            finally:
+                self._refreshing = False
+                self._first_change_while_refreshing = None
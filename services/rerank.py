@@ -0,0 +1,136 @@
+"""
+Vectorized `pg_trgm` compatible scoring of fetched candidates. Requires NumPy: `pip install numpy`.
+"""
+from typing import Any, Sequence
+
+from sqlalchemy import Column
+from sqlalchemy.orm import InstrumentedAttribute
+
+from services import trigram
+from services.search_service import SEARCH_MODES, SearchMode
+
+try:
+    import numpy as np
+except ImportError as exc:  # pragma: no cover
+    raise ImportError('NumPy is required for vectorized scoring: `pip install numpy`. ') from exc
+
+
+class VectorizedScorer:
+    """
+    Score many candidate texts against a term at once.
+
+    Unique trigrams of every candidate are packed into sparse CSR-like arrays of integer trigram ids. Term trigrams are
+    turned into boolean mask over trigrams vocabulary, so shared trigrams of all candidates are counted by single
+    `bincount` over the mask, and `similarity` of all candidates is computed in one batched operation.
+
+    Word similarity is bounded by shared part of term trigrams, so exact (sequential) `word_similarity` is computed only
+    for candidates sharing any term trigram, or passing `threshold` bound if provided. Others score `0`.
+
+    Ratios are `float32`, exactly as `pg_trgm` computes them.
+    """
+
+    def __init__(self, texts: Sequence[str]) -> None:
+        self.texts = list(texts)
+        vocabulary: dict[str, int] = {}
+        indices: list[int] = []
+        indptr = [0]
+        for text in self.texts:
+            indices.extend({vocabulary.setdefault(trigram_, len(vocabulary)) for trigram_ in trigram.trigrams(text)})
+            indptr.append(len(indices))
+
+        self._vocabulary = vocabulary
+        self._indices = np.asarray(indices, dtype=np.int32)
+        sizes = np.diff(np.asarray(indptr, dtype=np.int64))
+        self._sizes = sizes.astype(np.float32)
+        # candidate of every packed trigram
+        self._owners = np.repeat(np.arange(len(self.texts)), sizes)
+
+    def __len__(self) -> int:
+        return len(self.texts)
+
+    def _shared(self, term_trigrams: set[str]) -> 'np.ndarray':
+        mask = np.zeros(len(self._vocabulary), dtype=np.float32)
+        mask[[self._vocabulary[trigram_] for trigram_ in term_trigrams if trigram_ in self._vocabulary]] = 1
+        return np.bincount(self._owners, weights=mask[self._indices], minlength=len(self.texts)).astype(np.float32)
+
+    def similarity(self, term: str) -> 'np.ndarray':
+        """
+        `similarity(term, text)` of every candidate text.
+        """
+        term_trigrams = trigram.trigrams(term)
+        if not term_trigrams:
+            return np.zeros(len(self.texts), dtype=np.float32)
+        shared = self._shared(term_trigrams)
+        return shared / (np.float32(len(term_trigrams)) + self._sizes - shared)
+
+    def word_similarity(self, term: str, *, threshold: float | None = None) -> 'np.ndarray':
+        """
+        `word_similarity(term, text)` of every candidate text.
+        """
+        return self._word_similarity(term, 'word_similarity', threshold)
+
+    def strict_word_similarity(self, term: str, *, threshold: float | None = None) -> 'np.ndarray':
+        """
+        `strict_word_similarity(term, text)` of every candidate text.
+        """
+        return self._word_similarity(term, 'strict_word_similarity', threshold)
+
+    def score(self, term: str, mode: SearchMode = 'similarity', *, threshold: float | None = None) -> 'np.ndarray':
+        """
+        Ratio of search `mode` of every candidate text.
+        """
+        if mode not in SEARCH_MODES:
+            raise ValueError(f'Unsupported search mode: {mode}. ')
+        if mode == 'similarity':
+            return self.similarity(term)
+        return self._word_similarity(term, mode, threshold)
+
+    def _word_similarity(self, term: str, mode: str, threshold: float | None) -> 'np.ndarray':
+        term_trigrams = trigram.trigrams(term)
+        scores = np.zeros(len(self.texts), dtype=np.float32)
+        if not term_trigrams:
+            return scores
+
+        bound = self._shared(term_trigrams) / np.float32(len(term_trigrams))
+        candidates = np.flatnonzero(bound > 0 if threshold is None else (bound > 0) & (bound >= threshold))
+        function = trigram.WORD_SIMILARITY_FUNCTIONS[mode]
+        for idx in candidates:
+            scores[idx] = function(term, self.texts[idx])
+        return scores
+
+
+def rerank(
+    rows: Sequence[Any],
+    term: str,
+    *columns: Column[str] | InstrumentedAttribute[str] | Column[str | None] | InstrumentedAttribute[str | None],
+    mode: SearchMode = 'similarity',
+    weights: Sequence[float] | None = None,
+    limit: int | None = None,
+) -> list[tuple[Any, float]]:
+    """
+    Re-rank fetched rows (of `FuzzySearchService` search, for example) by similarity of `term` and `columns` values.
+    Return rows with their scores, the best first.
+
+    >>> rows = (await session.execute(search(term, limit=1000))).all()
+    >>> top = rerank(rows, term, Article.title, Article.body, weights=(1.0, 0.3), limit=20)
+
+    Columns are concatenated as `FuzzySearchService` does, or scored separately and averaged by `weights`.
+    """
+    if not columns:
+        raise ValueError('No columns. ')
+    if weights is not None and len(weights) != len(columns):
+        raise ValueError('Weights must be provided for every column. ')
+
+    def texts(*scored: Any) -> list[str]:
+        return [''.join(getattr(row, column.key) or '' for column in scored) for row in rows]
+
+    if weights is None:
+        scores = VectorizedScorer(texts(*columns)).score(term, mode)
+    else:
+        weighted = [
+            weight * VectorizedScorer(texts(column)).score(term, mode) for weight, column in zip(weights, columns)
+        ]
+        scores = (np.sum(weighted, axis=0) / np.float32(sum(weights))).astype(np.float32)
+
+    order = np.argsort(-scores, kind='stable')[:limit]
+    return [(rows[idx], float(scores[idx])) for idx in order]
@@ -1,7 +1,202 @@
-from sqlalchemy import Column, ColumnElement, Index, Select, Table, func, select, text
-from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import InstrumentedAttribute
+import functools
+import operator
+from typing import Any, AsyncGenerator, Literal, NamedTuple, Sequence
+from weakref import WeakKeyDictionary
+
+from sqlalchemy import (
+    BigInteger,
+    Column,
+    ColumnElement,
+    Computed,
+    Float,
+    Identity,
+    Index,
+    Insert,
+    Integer,
+    Join,
+    MetaData,
+    Row,
+    Select,
+    Table,
+    Text,
+    and_,
+    bindparam,
+    cast,
+    delete,
+    event,
+    func,
+    literal,
+    literal_column,
+    or_,
+    select,
+    text,
+    true,
+    tuple_,
+)
+from sqlalchemy.dialects.postgresql import ARRAY, REGCONFIG, TSVECTOR
+from sqlalchemy.engine import Connection, ScalarResult
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+from sqlalchemy.orm import DeclarativeBase, InstrumentedAttribute, Session, SessionTransaction
 from sqlalchemy.sql._typing import _DDLColumnArgument
+from sqlalchemy.util import await_only
+from sqlalchemy_utils import create_materialized_view
+
+from services.cache import SearchCache
+from services.ddl import CreateSyncFunction, CreateSyncTrigger, DropSyncFunction, TriggerEvent
+from services.indexes import create_index, index_name, index_validity, rebuild_index
+from services.instrumentation import SearchInstrumentation
+from services.terms import RoutedTerm, TermPolicy
+
+SearchMode = Literal['similarity', 'word_similarity', 'strict_word_similarity']
+
+
+class TrigramOperators(NamedTuple):
+    """
+    `pg_trgm` functions and operators implementing search mode. Operators take indexed expression as left operand, so
+    the same `gin_trgm_ops` or `gist_trgm_ops` index serves every mode.
+    """
+
+    function: str
+    match: str
+    distance: str
+    threshold: str
+    default_limit: float
+
+
+SEARCH_MODES: dict[str, TrigramOperators] = {
+    'similarity': TrigramOperators(
+        'similarity',
+        '%',
+        '<->',
+        'pg_trgm.similarity_threshold',
+        0.3,
+    ),
+    'word_similarity': TrigramOperators(
+        'word_similarity',
+        '%>',
+        '<->>',
+        'pg_trgm.word_similarity_threshold',
+        0.6,
+    ),
+    'strict_word_similarity': TrigramOperators(
+        'strict_word_similarity',
+        '%>>',
+        '<->>>',
+        'pg_trgm.strict_word_similarity_threshold',
+        0.5,
+    ),
+}
+
+# `Column.info` key of generated columns added by search services
+GENERATED_SEARCH_COLUMN = 'generated_search_column'
+
+# `Session.info` key of caches to invalidate on commit
+_PENDING_INVALIDATIONS = 'pending_search_cache_invalidations'
+
+# Thresholds already applied by `SET LOCAL` within root transaction. Used for skipping repeated round trips.
+_transaction_limits: WeakKeyDictionary[SessionTransaction, dict[str, str]] = WeakKeyDictionary()
+
+
+def source_tables(selectable: Select) -> list[Table]:
+    """
+    Tables selected from. The first one is the root: the leftmost table of the first join.
+    """
+    tables: list[Table] = []
+
+    def visit(from_clause):
+        if isinstance(from_clause, Join):
+            visit(from_clause.left)
+            visit(from_clause.right)
+        elif isinstance(from_clause, Table) and from_clause not in tables:
+            tables.append(from_clause)
+        elif not isinstance(from_clause, Table):
+            raise ValueError(f'Unsupported selectable: {from_clause}. Only tables and joins of tables are supported. ')
+
+    for from_clause in selectable.get_final_froms():
+        visit(from_clause)
+    return tables
+
+
+def row_identity_key(table: Table) -> str:
+    """
+    Name of column referencing row of `table` at search view or table.
+    """
+    if len(table.primary_key.columns) != 1:
+        raise ValueError(f'Table {table.name} must have single column primary key. ')
+    (pk,) = table.primary_key.columns
+    return f'{table.name}_{pk.name}'
+
+
+def result_columns(table: Table) -> list[Column]:
+    """
+    Columns of `table` selected by search. Generated columns of search services (marked by `GENERATED_SEARCH_COLUMN`
+    info) are skipped, as they only duplicate searched text.
+    """
+    return [column for column in table.columns if not column.info.get(GENERATED_SEARCH_COLUMN)]
+
+
+def with_row_identity(selectable: Select) -> Select:
+    """
+    Add primary keys of every selected table labeled as `<table>_<column>`.
+    """
+    keys = [table.primary_key.columns[0].label(row_identity_key(table)) for table in source_tables(selectable)]
+
+    selected = {column.name for column in selectable.selected_columns}
+    if conflicts := selected & {key.name for key in keys}:
+        raise ValueError(f'Selected columns conflict with row identity columns: {conflicts}. ')
+    return selectable.add_columns(*keys)
+
+
+def invalidate_on_commit(session: AsyncSession, service: 'FuzzySearchService') -> None:
+    """
+    Invalidate cached results of `service` right after session transaction is committed (and never if it is rolled
+    back). Invalidated before commit, cache is filled back by concurrent searches seeing old state, which is kept for
+    the whole TTL then.
+    """
+    if service.cache is None:
+        return
+    sync_session = session.sync_session
+    if not event.contains(sync_session, 'after_commit', _invalidate_caches):
+        event.listen(sync_session, 'after_commit', _invalidate_caches)
+        event.listen(sync_session, 'after_rollback', _discard_invalidations)
+    sync_session.info.setdefault(_PENDING_INVALIDATIONS, {})[service.cache_namespace] = service.cache
+
+
+def _invalidate_caches(session: Session) -> None:
+    # commit of `AsyncSession` runs in greenlet, so async cache is awaited before commit returns
+    for namespace, cache in session.info.pop(_PENDING_INVALIDATIONS, {}).items():
+        await_only(cache.invalidate(namespace))
+
+
+def _discard_invalidations(session: Session) -> None:
+    session.info.pop(_PENDING_INVALIDATIONS, None)
+
+
+class SearchCursor(NamedTuple):
+    """
+    Keyset pagination position: similarity ratio and primary key of the last fetched row.
+    """
+
+    similarity_ratio: float
+    key: tuple[Any, ...]
+
+
+class SearchHit(NamedTuple):
+    """
+    Search result of `FuzzySearchService.search`.
+
+    `keys`: Primary keys of source rows by key column names (`'<table>_<column>'` for materialized views and
+        incremental search tables).
+    `score`: Similarity ratio.
+    `fields`: Values of searched columns by names.
+    `entities`: ORM instances of source rows loaded by `search(..., load=...)`, in the order of `load` models.
+        `None` for rows missing in source tables (outer joined).
+    """
+
+    keys: dict[str, Any]
+    score: float
+    fields: dict[str, Any]
+    entities: tuple[Any, ...] = ()
 
 
 class FuzzySearchService:
@@ -16,7 +211,17 @@ class FuzzySearchService:
         self,
         *on_columns: Column[str] | InstrumentedAttribute[str] | Column[str | None] | InstrumentedAttribute[str | None],
         similarity_limit: float | None = None,
+        word_similarity_limit: float | None = None,
+        strict_word_similarity_limit: float | None = None,
+        mode: SearchMode = 'similarity',
+        weights: Sequence[float] | None = None,
         init_index: str | bool = False,
+        index_using: Literal['gin', 'gist'] = 'gin',
+        search_column: str | bool = False,
+        filter_columns: Sequence[Column | InstrumentedAttribute] = (),
+        cache: SearchCache | None = None,
+        instrumentation: SearchInstrumentation | None = None,
+        term_policy: TermPolicy | None = None,
     ) -> None:
         """
         Search service by Trigrams with `pg_trgm` Postgres extension.
@@ -28,12 +233,63 @@ class FuzzySearchService:
         >>> result = await session.execute(search('some term we want to find'))
 
         ### Params
-        `similarity_limit`: Postgres default: `0.3`. For using another value, you must set limit for current session:
+        `similarity_limit`: Postgres default: `0.3`. For using another value, you must set limit for transaction:
 
         >>> await set_similarity_limit(session)
 
+        `word_similarity_limit`, `strict_word_similarity_limit`: Postgres default: `0.6` and `0.5`.
+            Thresholds for corresponding search modes. Set for current transaction along with `similarity_limit`.
+
+        `mode`: Default search mode. Could be overridden on every search call.
+            * `'similarity'`: similarity of the whole term and the whole columns text (`%` operator).
+            * `'word_similarity'`: greatest similarity of the term and any continuous extent of columns text
+                (`<%` operator). Unlike `'similarity'`, ratio is not diluted by long texts, so matching on long columns
+                stays selective without dropping the limit down to almost zero.
+            * `'strict_word_similarity'`: the same, but extent boundaries must match word boundaries (`<<%` operator).
+
+            The same trigram index supports every mode.
+
+        `weights`: Weights of columns. Instead of single index on concatenated columns, every column is indexed and
+            searched separately. Matches of any column are selected (by `OR` of index friendly filters, so Postgres
+            combines small per-column indexes by BitmapOr), ranked by weighted average of columns similarity ratios.
+            So title hit is ranked above the same match deep in body and no false trigrams across column boundaries
+            are produced. KNN ordering is not supported.
+
+            >>> search = FuzzySearchService(Article.title, Article.body, weights=(1.0, 0.3), init_index=True)
+
+        `cache`: Results cache used by `fetch` and `search_many`. See `services.cache.InMemorySearchCache`.
+
+        `instrumentation`: Latency, rows and sampled plans recording of `fetch` and `search_many` executions.
+            See `services.instrumentation.SearchInstrumentation`.
+
+        `term_policy`: Terms normalization (lowercasing, punctuation collapsing, length capping) and routing by length:
+            short terms are searched by prefix, long ones by word similarity. See `services.terms.TermPolicy`.
+
+            >>> search = FuzzySearchService(Article.title, init_index=True, term_policy=TermPolicy(prefix_length=2))
+
         `init_index`: `True` or `'index_name'`.
             Calling for Index initialization. But it do *not* actually create database index.
+            Weighted search and prefix routing of `term_policy` (prefix of every column is matched) use index of
+            every column. Their names are suffixed by column name: `'index_name_column'` (`'table_column_trgm_idx'`
+            for `True`, so they never collide with naming convention of concatenated index).
+
+        `index_using`: `'gin'` or `'gist'`. GIN index is faster for `%` filtering, but results still have to be sorted
+            by similarity. GiST index additionally supports KNN ordering by `<->` distance operator, so top matches
+            are returned straight from index scan. See `knn` search param.
+
+        `search_column`: `True` or `'column_name'` (`'search_text'` by default). Add stored generated column of
+            lowercased columns text joined by spaces to the table: `GENERATED ALWAYS AS (...) STORED`. Index and
+            queries target that column instead of `coalesce` concatenation expression, so text is computed once per
+            write, plans are simpler and index is matched by column. Not supported for weighted search.
+
+            >>> search = FuzzySearchService(Article.title, Article.body, search_column=True, init_index=True)
+
+        `filter_columns`: Columns of the table usually filtered by (tenant, author). They lead the columns of search
+            index, so `filters` of search narrow candidates inside the index instead of after trigram recheck.
+            Requires `btree_gin` (or `btree_gist` for GiST index) extension. See `partial_index` for hot filter values.
+
+            >>> search = FuzzySearchService(Article.title, filter_columns=(Article.author_id,), init_index=True)
+            >>> result = await session.execute(search('some term', filters={'author_id': author_id}))
 
         ### Create Index
 
@@ -51,6 +307,15 @@ class FuzzySearchService:
         >>> )
 
         Issue: https://github.com/sqlalchemy/alembic/issues/676
+
+        ### Pagination
+
+        Limit results and resume from the last fetched row by keyset (similarity ratio + primary key) instead of
+        OFFSET scans:
+
+        >>> page = (await session.execute(search(term, include_similarity_ratio=True, limit=20))).all()
+        >>> cursor = search.cursor(page[-1])
+        >>> next_page = await session.execute(search(term, include_similarity_ratio=True, limit=20, after=cursor))
         """
         self._entities: set[Table] = {column.table for column in on_columns}
         if len(self._entities) > 1:
@@ -59,57 +324,748 @@ class FuzzySearchService:
                 'Use MaterializedSearchService instead. '
             )
 
+        if index_using not in ('gin', 'gist'):
+            raise ValueError(f'Unsupported index method: {index_using}. ')
+        if mode not in SEARCH_MODES:
+            raise ValueError(f'Unsupported search mode: {mode}. ')
+        if weights is not None and len(weights) != len(on_columns):
+            raise ValueError('Weights must be provided for every column. ')
+        if search_column and weights is not None:
+            raise ValueError('Search column is not supported for weighted search. ')
+        if {column.table for column in filter_columns} - self._entities:
+            raise ValueError('Filter columns must belong to the table of searched columns. ')
+
         self._columns = on_columns
+        self.weights = tuple(weights) if weights is not None else None
         self._similarity_limit = similarity_limit
+        self._word_similarity_limit = word_similarity_limit
+        self._strict_word_similarity_limit = strict_word_similarity_limit
+        self.mode = mode
+        self.cache = cache
+        self.instrumentation = instrumentation
+        self.term_policy = term_policy
+        self.filter_columns = tuple(filter_columns)
+        self._statements: dict[tuple, Select] = {}
+        self.index_dialect_kw = dict(
+            postgresql_using=index_using,
+            postgresql_ops={'columns': f'{index_using}_trgm_ops'},
+        )
+
+        (table,) = self._entities
+        self.search_column: Column[str] | None = None
+        if search_column:
+            self.search_column = Column(
+                search_column if isinstance(search_column, str) else 'search_text',
+                Text,
+                Computed(func.lower(self.join_columns(*on_columns)), persisted=True),
+                nullable=False,
+                info={GENERATED_SEARCH_COLUMN: True},
+            )
+            table.append_column(self.search_column)
 
         self.index: Index | None = None
-        if init_index:
+        self.indexes: list[Index] = []
+        column_indexes = [
+            Index(
+                f'{init_index}_{column.name}'
+                if isinstance(init_index, str)
+                else f'{table.name}_{column.name}_trgm_idx',
+                *self.filter_columns,
+                column,
+                postgresql_using=index_using,
+                postgresql_ops={column.name: f'{index_using}_trgm_ops'},
+            )
+            for column in (on_columns if init_index and (self.weights or self._routes_prefix) else ())
+        ]
+        if init_index and self.search_column is not None:
+            self.index = Index(
+                init_index if isinstance(init_index, str) else None,
+                *self.filter_columns,
+                self.search_column,
+                postgresql_using=index_using,
+                postgresql_ops={self.search_column.name: f'{index_using}_trgm_ops'},
+            )
+            self.indexes = [self.index]
+        elif init_index and not self.weights:
             self.index = Index(
                 init_index if isinstance(init_index, str) else None,
+                *self.filter_columns,
                 self.concat_columns(*on_columns).label('columns'),
                 **self.index_dialect_kw,  # type: ignore
             )
+            self.indexes = [self.index]
+        self.indexes.extend(column_indexes)
+
+    @property
+    def _routes_prefix(self) -> bool:
+        return self.term_policy is not None and self.term_policy.prefix_length > 0
 
     @property
     def columns(self):
         return self._columns
 
+    @property
+    def key_columns(self) -> tuple[Column, ...]:
+        """
+        Columns identifying search result row. Used for keyset pagination.
+        """
+        (table,) = self._entities
+        return tuple(table.primary_key.columns)
+
+    @property
+    def source_key_columns(self) -> tuple[Column, ...]:
+        """
+        Columns referencing primary keys of source rows. Keys of `SearchHit` results.
+        """
+        return self.key_columns
+
     @classmethod
     def concat_columns(cls, *columns: _DDLColumnArgument) -> ColumnElement[str]:
         if not columns:
             raise ValueError('No columns. ')
 
-        joined_columns = func.coalesce(columns[0], '')
+        # empty string is rendered inline, so query expression exactly matches index expression even for generic plans
+        empty = literal_column("''", Text)
+        joined_columns = func.coalesce(columns[0], empty)
         for idx in range(1, len(columns)):
-            joined_columns = joined_columns.concat(func.coalesce(columns[idx], ''))  # type: ignore
+            joined_columns = joined_columns.concat(func.coalesce(columns[idx], empty))  # type: ignore
+        return joined_columns
+
+    @classmethod
+    def join_columns(cls, *columns: _DDLColumnArgument) -> ColumnElement[str]:
+        """
+        Columns text joined by spaces, so words of different columns never produce false trigrams at boundaries.
+        """
+        if not columns:
+            raise ValueError('No columns. ')
+        empty, separator = literal_column("''", Text), literal_column("' '", Text)
+        joined_columns = func.coalesce(columns[0], empty)
+        for column in columns[1:]:
+            joined_columns = joined_columns.concat(separator).concat(func.coalesce(column, empty))  # type: ignore
         return joined_columns
 
-    async def set_similarity_limit(self, session: AsyncSession, limit: float | None = None) -> None:
+    @property
+    def similarity_limits(self) -> dict[str, float]:
+        """
+        Configured thresholds by search mode.
+        """
+        limits = {
+            'similarity': self._similarity_limit,
+            'word_similarity': self._word_similarity_limit,
+            'strict_word_similarity': self._strict_word_similarity_limit,
+        }
+        return {mode: limit for mode, limit in limits.items() if limit is not None}
+
+    def threshold(self, mode: SearchMode | None = None) -> float:
+        """
+        Threshold applied by `set_similarity_limit` for search `mode`.
+        """
+        mode = mode or self.mode
+        return self.similarity_limits.get(mode, SEARCH_MODES[mode].default_limit)
+
+    async def set_similarity_limit(
+        self, session: AsyncSession, limit: float | None = None, *, local: bool = True
+    ) -> None:
+        """
+        Set limits for current transaction. `limit` overrides `similarity_limit` of the service.
+
+        Every threshold is set (not configured ones to Postgres defaults), so services with different limits never
+        affect each other, even on the same pooled connection. Limits are applied only once per transaction: repeated
+        calls with the same limits do not make a round trip to database. Still, the first search of every transaction
+        pays one extra round trip, so searches at their own short transactions (like `SearchExecutor.fetch`) make two
+        round trips each. Limits are always applied within savepoints: `SET LOCAL` of released savepoint outlives it,
+        while rolled back one restores limits of outer transaction.
+
+        `local`: Pass `False` to set limits for the whole database session (connection) instead. Beware, session limits
+            are kept by pooled connection after it is returned to the pool.
+        """
+        limits = {mode: operators.default_limit for mode, operators in SEARCH_MODES.items()}
+        limits.update(self.similarity_limits)
+        if limit is not None:
+            limits['similarity'] = limit
+        values = {SEARCH_MODES[mode].threshold: str(value) for mode, value in limits.items()}
+
+        await session.connection()  # begin transaction if not yet
+        transaction = session.sync_session.get_transaction()
+        if local and not session.sync_session.in_nested_transaction():
+            if _transaction_limits.get(transaction) == values:  # type: ignore[arg-type]
+                return
+            _transaction_limits[transaction] = values  # type: ignore[index]
+        else:
+            _transaction_limits.pop(transaction, None)  # type: ignore[arg-type]
+
+        await session.execute(select(*(func.set_config(name, value, local) for name, value in values.items())))
+
+    async def create_indexes(self, engine: AsyncEngine) -> None:
+        """
+        Create search indexes by `CREATE INDEX CONCURRENTLY`, so the table stays writable while indexes are built.
+        Existing valid indexes are kept, invalid ones (left by failed concurrent builds) are built again.
+        """
+        for index in self.indexes:
+            await create_index(engine, index)
+
+    async def rebuild_indexes(self, engine: AsyncEngine) -> None:
+        """
+        Build search indexes again under temporary names concurrently and swap them in place of the old ones.
+        Search keeps using old indexes while new ones are built.
+        """
+        for index in self.indexes:
+            await rebuild_index(engine, index)
+
+    async def invalid_indexes(self, engine: AsyncEngine) -> list[str]:
+        """
+        Names of search indexes, which are missing or invalid (left by failed concurrent builds).
+        """
+        names = [index_name(index) for index in self.indexes]
+        async with engine.connect() as connection:
+            validity = await index_validity(connection, names)
+        return [name for name in names if not validity.get(name)]
+
+    def key_expression(self, key: ColumnElement) -> ColumnElement:
+        """
+        Expression comparing key column or cursor key value at keyset pagination.
+        """
+        return key
+
+    def source_key(self, table: Table) -> Column:
         """
-        Set limit for current database session (engine).
+        Column of search results referencing primary key of source `table` rows.
         """
-        if limit is None and self._similarity_limit is None:
-            raise ValueError('None limit. ')
-        await session.execute(select(func.set_limit(text(str(self._similarity_limit)))))
+        if table not in self._entities:
+            raise ValueError(f'Table {table.name} is not searched by the service. ')
+        row_identity_key(table)  # single column primary key is required
+        return table.primary_key.columns[0]
 
-    def __call__(self, term: str, *, order: bool = True, include_similarity_ratio: bool = False) -> Select:
+    def route(self, term: str, mode: SearchMode | None = None) -> RoutedTerm:
+        """
+        Normalized term and the way it is searched by `term_policy`. Without policy term is searched as is.
+        """
+        mode = mode or self.mode
+        if self.term_policy is None:
+            return RoutedTerm(term, mode)
+        return self.term_policy.route(term, mode)
+
+    def cursor(self, row: Row) -> SearchCursor:
+        """
+        Get keyset pagination position from the last fetched row.
+        Row must be selected with `include_similarity_ratio=True`.
+        """
+        return SearchCursor(row.similarity_ratio, tuple(row._mapping[column] for column in self.key_columns))
+
+    def __call__(
+        self,
+        term: str,
+        *,
+        order: bool = True,
+        include_similarity_ratio: bool = False,
+        limit: int | None = None,
+        after: SearchCursor | None = None,
+        knn: bool = False,
+        mode: SearchMode | None = None,
+        filters: dict[str, Any] | None = None,
+    ) -> Select:
         """
         Search `term` string.
+
+        `limit`: Return only top `limit` matches. Postgres uses bounded top-N heapsort instead of a full sort then.
+        `after`: Return matches following the cursor position. See `cursor` method.
+        `knn`: Order by `<->` trigram distance operator instead of similarity ratio. Results are the same, but with
+            `index_using='gist'` top matches are taken from index scan without computing and sorting every candidate.
+        `mode`: Override default search mode of the service.
+        `filters`: Values of table columns by column name, matched rows must be equal to. Filters are applied along
+            with trigram match, so with `filter_columns` index they narrow candidates inside the index.
+
+        Term is normalized and routed by `term_policy` if any, so short terms are searched by prefix.
+
+        Statement is built once for every set of options and bound to `term` and other values on every call. For hot
+        paths use cached statement directly: `session.execute(search.statement(...), search.parameters(term, ...))`.
+        """
+        term, mode, prefix = self.route(term, mode)
+        statement = self.statement(
+            order=order,
+            include_similarity_ratio=include_similarity_ratio,
+            limit=limit is not None,
+            after=after is not None,
+            knn=knn,
+            mode=mode,
+            prefix=prefix,
+            filters=tuple(filters or ()),
+        )
+        return statement.params(self.parameters(term, limit=limit, after=after, filters=filters))
+
+    def statement(
+        self,
+        *,
+        order: bool = True,
+        include_similarity_ratio: bool = False,
+        limit: bool = False,
+        after: bool = False,
+        knn: bool = False,
+        mode: SearchMode | None = None,
+        prefix: bool = False,
+        filters: Sequence[str] = (),
+    ) -> Select:
+        """
+        Search statement with `term`, `limit`, cursor and `filters` (column names) bound parameters. See `parameters`.
+        Statement is cached by options, so SQLAlchemy compiled cache and asyncpg prepared statements are reused.
+
+        `prefix`: Select rows starting with `term` (case-insensitive) instead of trigram matches. Ratio and ordering are
+            the same as for `mode`.
+        """
+        filters = tuple(sorted(filters))
+        options = (order, include_similarity_ratio, limit, after, knn, mode or self.mode, prefix, filters)
+        if options not in self._statements:
+            self._statements[options] = self._build_statement(
+                bindparam('term', type_=Text),
+                order=order,
+                include_similarity_ratio=include_similarity_ratio,
+                limit=limit,
+                after=after,
+                knn=knn,
+                mode=mode,
+                prefix=prefix,
+                filters=filters,
+            )
+        return self._statements[options]
+
+    def parameters(
+        self,
+        term: str,
+        *,
+        limit: int | None = None,
+        after: SearchCursor | None = None,
+        filters: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
         """
-        columns = self.concat_columns(*self.columns)
-        entities = self._entities.copy()
+        Values of `statement` bound parameters.
+        """
+        parameters: dict[str, Any] = {'term': term}
+        parameters.update({f'filter_{name}': value for name, value in (filters or {}).items()})
+        if limit is not None:
+            parameters['limit'] = limit
+        if after is not None:
+            parameters['after_similarity_ratio'] = after.similarity_ratio
+            parameters.update({f'after_key_{idx}': value for idx, value in enumerate(after.key)})
+        return parameters
+
+    def _build_statement(
+        self,
+        term: ColumnElement[str],
+        *,
+        order: bool,
+        include_similarity_ratio: bool,
+        limit: bool,
+        after: bool,
+        knn: bool,
+        mode: SearchMode | None,
+        prefix: bool = False,
+        filters: Sequence[str] = (),
+    ) -> Select:
+        mode = mode or self.mode
+        if mode not in SEARCH_MODES:
+            raise ValueError(f'Unsupported search mode: {mode}. ')
+        similarity_ratio, match, distance = self._match(term, SEARCH_MODES[mode], knn=knn, prefix=prefix)
+
+        (table,) = self._entities
+        entities: list[Any] = result_columns(table)
         if include_similarity_ratio:
-            entities.add(func.similarity(columns, term).label('similarity_ratio'))  # type: ignore
+            entities.append(similarity_ratio.label('similarity_ratio'))
+
+        return self._paginate(
+            select(*entities).where(match, *self._filter(filters)),
+            similarity_ratio,
+            order=order,
+            limit=limit,
+            after=after,
+            distance=distance if knn else None,
+        )
+
+    def partial_index(self, name: str, **values: Any) -> Index:
+        """
+        Trigram index of rows with `values` of table columns only, for hot filter values (large tenants). Partial index
+        is much smaller than the whole table one. Planner picks it when search `filters` have the same values (custom
+        plans substitute bound values, so prepared statements keep using it until a generic plan is chosen).
+
+        >>> search.partial_index('articles_author_trgm_idx', author_id=author_id)
+
+        Index is added to `indexes`, so it is created with the table and managed by `create_indexes`.
+        """
+        if self.weights:
+            raise ValueError('Partial index is not supported for weighted search. ')
+        (table,) = self._entities
+        if unknown := set(values) - set(table.c.keys()):
+            raise ValueError(f'Unknown filter columns: {unknown}. ')
+
+        predicate = and_(*(table.c[column] == literal(value, table.c[column].type) for column, value in values.items()))
+        using = self.index_dialect_kw['postgresql_using']
+        if self.search_column is not None:
+            expression: Any = self.search_column
+            ops = {self.search_column.name: f'{using}_trgm_ops'}
+        else:
+            expression = self.concat_columns(*self.columns).label('columns')
+            ops = {'columns': f'{using}_trgm_ops'}
+        index = Index(name, expression, postgresql_using=using, postgresql_ops=ops, postgresql_where=predicate)
+        self.indexes.append(index)
+        return index
+
+    def _filter(self, filters: Sequence[str]) -> list[ColumnElement[bool]]:
+        """
+        Equality conditions of table columns named by `filters`, bound to `filter_<name>` parameters.
+        """
+        (table,) = self._entities
+        conditions = []
+        for name in filters:
+            if name not in table.c:
+                raise ValueError(f'Unknown filter column: {name}. ')
+            conditions.append(table.c[name] == bindparam(f'filter_{name}', type_=table.c[name].type))
+        return conditions
 
-        statement = select(*entities).where(
-            columns.self_group().bool_op("%")(term),
+    def _match(
+        self, term: ColumnElement[str], operators: TrigramOperators, *, knn: bool, prefix: bool = False
+    ) -> tuple[ColumnElement[float], ColumnElement[bool], ColumnElement[float] | None]:
+        """
+        Similarity ratio, index friendly filter and distance (not supported by weighted search) of `term` match.
+        Prefix filter is `ILIKE` of every column, served by indexes of columns (see `init_index`). Without them short
+        prefixes are matched by table scan: terms of 1-2 characters have no trigrams for index of whole expression.
+        """
+        columns = (
+            self.search_column if self.search_column is not None else self.concat_columns(*self.columns).self_group()
         )
+        # pattern is rendered inline, so statement is bound to term only (term is normalized, no wildcards left)
+        pattern = term.concat(literal_column("'%'", Text))
+        if self.weights:
+            if knn:
+                raise ValueError('KNN ordering is not supported for weighted search. ')
+            weighted_ratios: list[ColumnElement[float]] = [
+                weight * func.coalesce(getattr(func, operators.function)(term, column), 0)
+                for weight, column in zip(self.weights, self.columns)
+            ]
+            similarity_ratio = functools.reduce(operator.add, weighted_ratios) / sum(self.weights)
+            matches = [
+                column.ilike(pattern) if prefix else column.bool_op(operators.match)(term) for column in self.columns
+            ]
+            return similarity_ratio, or_(*matches), None
+
+        return (
+            getattr(func, operators.function)(term, columns),
+            or_(*(column.ilike(pattern) for column in self.columns))
+            if prefix
+            else columns.bool_op(operators.match)(term),
+            columns.op(operators.distance, return_type=Float)(term),
+        )
+
+    def _paginate(
+        self,
+        statement: Select,
+        similarity_ratio: ColumnElement[float],
+        *,
+        order: bool,
+        limit: bool,
+        after: bool,
+        distance: ColumnElement[float] | None = None,
+    ) -> Select:
+        """
+        Apply ordering by `similarity_ratio` (or KNN `distance`), keyset condition and limit.
+        """
+        keyset = limit or after
+        if keyset and not order:
+            raise ValueError('Pagination requires ordered results. ')
+        if after:
+            if not self.key_columns:
+                raise ValueError(f'No key columns to paginate {self.__class__.__name__} results. ')
+            cursor_keys = [
+                bindparam(f'after_key_{idx}', type_=column.type) for idx, column in enumerate(self.key_columns)
+            ]
+            statement = statement.where(
+                tuple_(similarity_ratio, *map(self.key_expression, self.key_columns))
+                < tuple_(bindparam('after_similarity_ratio', type_=Float), *map(self.key_expression, cursor_keys))
+            )
+
+        if order and distance is not None:
+            statement = statement.order_by(distance)
+            if keyset:
+                # distance is `1 - ratio`, so it keeps the same order as keyset condition above
+                statement = statement.order_by(similarity_ratio.desc())
+        elif order:
+            statement = statement.order_by(similarity_ratio.desc())
+        if keyset:
+            # tiebreaker, so rows with equal ratio are never skipped or repeated between pages
+            statement = statement.order_by(*(self.key_expression(column).desc() for column in self.key_columns))
 
-        if order:
-            statement = statement.order_by(func.similarity(columns, term).desc())
+        if limit:
+            statement = statement.limit(bindparam('limit', type_=Integer))
 
         return statement
 
+    @property
+    def cache_namespace(self) -> str:
+        """
+        Prefix of cache keys. Unique for searched table and columns.
+        """
+        (table,) = self._entities
+        columns = ','.join(column.name for column in self.columns)
+        weights = f'[{",".join(map(str, self.weights))}]' if self.weights else ''
+        search_column = f'+{self.search_column.name}' if self.search_column is not None else ''
+        return f'{table.name}({columns}){weights}{search_column}'
+
+    def cache_key(
+        self,
+        term: str,
+        *,
+        limit: int | None,
+        knn: bool = False,
+        mode: SearchMode | None = None,
+        batch: bool = False,
+        prefix: bool = False,
+        filters: dict[str, Any] | None = None,
+    ) -> str:
+        """
+        Key of cached search results. Term is normalized as `pg_trgm` ignores case and whitespaces between words.
+        """
+        mode = mode or self.mode
+        threshold = self.threshold(mode)
+        kind = 'batch' if batch else 'prefix' if prefix else 'fetch'
+        options = f'{kind}:{mode}:{threshold}:{limit}:{knn:d}'
+        if filters:
+            options += ':' + ','.join(f'{name}={value}' for name, value in sorted(filters.items()))
+        return f'{self.cache_namespace}:{options}:{" ".join(term.lower().split())}'
+
+    async def fetch(
+        self,
+        session: AsyncSession,
+        term: str,
+        *,
+        limit: int | None = None,
+        knn: bool = False,
+        mode: SearchMode | None = None,
+        filters: dict[str, Any] | None = None,
+    ) -> list[Row]:
+        """
+        Search `term` string and return matched rows with `similarity_ratio`. Results are taken from `cache` if any.
+        """
+        term, mode, prefix = self.route(term, mode)
+        key = (
+            self.cache_key(term, limit=limit, knn=knn, mode=mode, prefix=prefix, filters=filters) if self.cache else ''
+        )
+        if self.cache and (cached := await self.cache.get(key)) is not None:
+            return list(cached)
+
+        await self.set_similarity_limit(session)
+        statement = self.statement(
+            include_similarity_ratio=True,
+            limit=limit is not None,
+            knn=knn,
+            mode=mode,
+            prefix=prefix,
+            filters=tuple(filters or ()),
+        )
+        parameters = self.parameters(term, limit=limit, filters=filters)
+        result = await self._execute(session, statement, parameters, terms=[term], mode=mode)
+
+        if self.cache:
+            await self.cache.set(key, result)
+        return list(result)
+
+    async def search(
+        self,
+        session: AsyncSession,
+        term: str,
+        *,
+        limit: int | None = 10,
+        knn: bool = False,
+        mode: SearchMode | None = None,
+        filters: dict[str, Any] | None = None,
+        load: Sequence[type[DeclarativeBase]] = (),
+    ) -> list[SearchHit]:
+        """
+        Search `term` string and return `SearchHit` results instead of rows. See `fetch` for params.
+
+        >>> hits = await search.search(session, 'some term we want to find', limit=20, load=[Article])
+        >>> [(hit.score, hit.fields['title'], hit.entities[0].author_id) for hit in hits]
+
+        `load`: ORM models of source tables. Their instances are loaded by single `IN` query per model.
+        """
+        rows = await self.fetch(session, term, limit=limit, knn=knn, mode=mode, filters=filters)
+        hits = [
+            SearchHit(
+                keys={column.name: row._mapping[column.name] for column in self.source_key_columns},
+                score=row.similarity_ratio,
+                fields={column.name: row._mapping[column.name] for column in self.columns},
+            )
+            for row in rows
+        ]
+        if not load or not hits:
+            return hits
+
+        keys: list[str] = []
+        loaded: list[dict[Any, Any]] = []
+        for model in load:
+            mapper = model.__mapper__
+            if not isinstance(mapper.local_table, Table):
+                raise ValueError(f'Model {model.__name__} is not mapped to table. ')
+            key = self.source_key(mapper.local_table).name
+            (primary_key,) = mapper.primary_key
+            values = {row._mapping[key] for row in rows} - {None}
+            instances: ScalarResult[Any] = (
+                await session.execute(select(model).where(primary_key.in_(values)))
+            ).scalars()
+            keys.append(key)
+            loaded.append({mapper.primary_key_from_instance(instance)[0]: instance for instance in instances})
+
+        return [
+            hit._replace(entities=tuple(instances.get(row._mapping[key]) for key, instances in zip(keys, loaded)))
+            for hit, row in zip(hits, rows)
+        ]
+
+    async def stream(
+        self,
+        session: AsyncSession,
+        term: str,
+        *,
+        chunk_size: int = 1000,
+        order: bool = True,
+        include_similarity_ratio: bool = True,
+        knn: bool = False,
+        mode: SearchMode | None = None,
+        filters: dict[str, Any] | None = None,
+    ) -> AsyncGenerator[Sequence[Row], None]:
+        """
+        Search `term` string and yield matched rows by chunks of `chunk_size` rows. Rows are fetched from server side
+        cursor, so memory stays flat for result sets of any size. Session transaction must be kept open while iterating.
+
+        >>> async for chunk in search.stream(session, 'some term we want to find', chunk_size=1000):
+        ...     ...
+
+        Cursor is closed once iteration is over. When iteration could be stopped early, close the stream explicitly
+        by `contextlib.aclosing`, otherwise cursor is kept open until the generator is garbage collected.
+
+        See `services.export` for writing chunks to CSV or JSON Lines files.
+        """
+        if chunk_size <= 0:
+            raise ValueError('Chunk size must be positive. ')
+
+        await self.set_similarity_limit(session)
+        statement = self(
+            term, order=order, include_similarity_ratio=include_similarity_ratio, knn=knn, mode=mode, filters=filters
+        )
+        result = await session.stream(statement.execution_options(yield_per=chunk_size))
+        try:
+            async for chunk in result.partitions():
+                yield chunk
+        finally:
+            await result.close()
+
+    async def _execute(
+        self,
+        session: AsyncSession,
+        statement: Select,
+        parameters: dict[str, Any],
+        *,
+        terms: list[str],
+        mode: SearchMode | None,
+    ) -> list[Row]:
+        if self.instrumentation is None:
+            return list((await session.execute(statement, parameters)).all())
+        mode = mode or self.mode
+        return await self.instrumentation.execute(
+            session,
+            statement,
+            parameters,
+            service=self.cache_namespace,
+            mode=mode,
+            threshold=self.threshold(mode),
+            terms=terms,
+        )
+
+    def batch(
+        self,
+        terms: Sequence[str],
+        *,
+        per_term_limit: int = 10,
+        knn: bool = False,
+        mode: SearchMode | None = None,
+        filters: dict[str, Any] | None = None,
+    ) -> Select:
+        """
+        Search every term of `terms` at single query. Top `per_term_limit` matches of every term are selected by
+        `unnest(terms) WITH ORDINALITY CROSS JOIN LATERAL (...)`, labeled by `term` and `similarity_ratio`. Rows are
+        ordered by terms order, then the same way as `__call__` orders matches. `filters` apply to matches of every
+        term.
+        """
+        filter_names = tuple(sorted(filters or ()))
+        options = ('batch', knn, mode or self.mode, filter_names)
+        if options not in self._statements:
+            terms_table = (
+                func.unnest(bindparam('terms', type_=ARRAY(Text)))
+                .table_valued('term', with_ordinality='ordinality')
+                .render_derived('terms')
+            )
+            matches = self._build_statement(
+                terms_table.c.term,
+                order=True,
+                include_similarity_ratio=True,
+                limit=True,
+                after=False,
+                knn=knn,
+                mode=mode,
+                filters=filter_names,
+            ).lateral('matches')
+            self._statements[options] = (
+                select(terms_table.c.term, matches)
+                .select_from(terms_table)
+                .join(matches, true())
+                .order_by(
+                    terms_table.c.ordinality,
+                    matches.c.similarity_ratio.desc(),
+                    *(self.key_expression(matches.c[column.name]).desc() for column in self.key_columns),
+                )
+            )
+        filter_values = {f'filter_{name}': value for name, value in (filters or {}).items()}
+        return self._statements[options].params(terms=list(terms), limit=per_term_limit, **filter_values)
+
+    async def search_many(
+        self,
+        session: AsyncSession,
+        terms: Sequence[str],
+        *,
+        per_term_limit: int = 10,
+        knn: bool = False,
+        mode: SearchMode | None = None,
+        filters: dict[str, Any] | None = None,
+    ) -> dict[str, list[Row]]:
+        """
+        Search every term of `terms` at single round trip. Return matches grouped by term.
+        Results of every term are taken from `cache` if any, only missed terms are searched.
+        Terms are searched as is: all of them share single statement, so `term_policy` routing is not applied.
+        """
+        grouped: dict[str, list[Row]] = {term: [] for term in terms}
+        missed = list(grouped)
+        if self.cache:
+            missed = []
+            for term in grouped:
+                cached = await self.cache.get(
+                    self.cache_key(term, limit=per_term_limit, knn=knn, mode=mode, batch=True, filters=filters)
+                )
+                if cached is None:
+                    missed.append(term)
+                else:
+                    grouped[term] = list(cached)
+        if not missed:
+            return grouped
+
+        await self.set_similarity_limit(session)
+        statement = self.batch(missed, per_term_limit=per_term_limit, knn=knn, mode=mode, filters=filters)
+        for row in await self._execute(session, statement, {}, terms=missed, mode=mode):
+            grouped[row.term].append(row)
+
+        if self.cache:
+            for term in missed:
+                await self.cache.set(
+                    self.cache_key(term, limit=per_term_limit, knn=knn, mode=mode, batch=True, filters=filters),
+                    grouped[term],
+                )
+        return grouped
+
 
 class MaterializedSearchService(FuzzySearchService):
     """
@@ -131,7 +1087,19 @@ class MaterializedSearchService(FuzzySearchService):
     >>> result = await session.execute(full_search_service('some term we want to find'))
 
     Instead of columns, view table must be provided. And after every depending tables updates or before every search
-    query `refresh` method should be called.
+    query `refresh` method should be called. Or use `services.refresher.BackgroundRefresher` for coalescing refreshes.
+
+    ### Row identity.
+
+    Create view by `from_select` to carry primary keys of every selected table into the view (as `<table>_<column>`
+    columns). Unique index on them is created with the view, so non-blocking `refresh(concurrently=True)` works out of
+    the box, and search results could be paginated and linked to source rows.
+
+    >>> full_search_service = MaterializedSearchService.from_select(
+    ...     'full_search_service_view',
+    ...     select(User.name, User.email, Article.title, Article.body).join(Article, isouter=True),
+    ...     Base.metadata,
+    ... )
 
     ### Migrations:
 
@@ -139,18 +1107,78 @@ class MaterializedSearchService(FuzzySearchService):
     For alembic migration raw SQL might be used (or `alembic_utils` with PGMaterializedView).
     """
 
-    def __init__(self, view: Table, *, similarity_limit: float | None = None, init_index: str | bool = False) -> None:
+    def __init__(
+        self,
+        view: Table,
+        *,
+        key_columns: Sequence[Column] = (),
+        sources: Sequence[Table] = (),
+        filter_columns: Sequence[str | Column] = (),
+        init_index: str | bool = False,
+        **kwargs: Any,
+    ) -> None:
+        """
+        `filter_columns`: View columns (or their names, see `from_select`) usually filtered by. They are not searched.
+        `kwargs`: Options of `FuzzySearchService`, except `search_column`: generated columns are not supported by views.
+        """
+        if kwargs.get('search_column'):
+            raise ValueError('Search column is not supported for materialized views. ')
         self.view = view
+        self.sources = tuple(sources)
+        self._key_columns = tuple(key_columns)
+        filters = tuple(view.c[column] if isinstance(column, str) else column for column in filter_columns)
         super().__init__(
-            *self.view.columns,
-            similarity_limit=similarity_limit,
+            *(column for column in self.view.columns if column not in {*self._key_columns, *filters}),
+            filter_columns=filters,
             init_index=f'{self.view.name}_trgm_idx' if init_index is True else init_index,
+            **kwargs,
         )
 
+        self.key_index: Index | None = None
+        if self._key_columns:
+            self.key_index = Index(f'{self.view.name}_key_idx', *self._key_columns, unique=True)
+
+    @classmethod
+    def from_select(
+        cls,
+        name: str,
+        selectable: Select,
+        metadata: MetaData,
+        **kwargs: Any,
+    ) -> 'MaterializedSearchService':
+        """
+        Create materialized view carrying primary keys of every selected table and search service on it.
+        """
+        view = create_materialized_view(name, with_row_identity(selectable), metadata)
+        sources = source_tables(selectable)
+        key_columns = [view.c[row_identity_key(table)] for table in sources]
+        return cls(view, key_columns=key_columns, sources=sources, **kwargs)
+
+    @property
+    def key_columns(self) -> tuple[Column, ...]:
+        # primary key of view table is composed of all its columns, so only explicitly provided keys identify rows
+        return self._key_columns
+
+    def key_expression(self, key: ColumnElement) -> ColumnElement:
+        # keys of outer joined tables could be NULL, which is not comparable
+        return func.coalesce(cast(key, Text), '')
+
+    def source_key(self, table: Table) -> Column:
+        name = row_identity_key(table)
+        if name not in self.view.c:
+            raise ValueError(f'View {self.view.name} has no row identity column of table {table.name}. ')
+        return self.view.c[name]
+
     async def refresh(self, session: AsyncSession, *, concurrently: bool = False) -> None:
         """
         Update materialized view depending on related tables state.
+
+        `concurrently`: Refresh without locking out concurrent selects. Requires unique index, see `from_select`.
+
+        Cached search results are invalidated once session transaction is committed.
         """
+        if concurrently and not self.key_index:
+            raise ValueError('Concurrent refresh requires unique index on view. Use `from_select` for view creation. ')
         # Since session.execute() bypasses autoflush, we must manually flush in
         # order to include newly-created/modified objects in the refresh.
         await session.flush()
@@ -162,3 +1190,272 @@ class MaterializedSearchService(FuzzySearchService):
                 )
             )
         )
+        invalidate_on_commit(session, self)
+
+
+class IncrementalSearchService(FuzzySearchService):
+    """
+    Unlike `MaterializedSearchService` implement search on regular table kept in sync with depending tables by
+    triggers. On every change only search rows of affected source rows are rewritten, so write cost scales with the
+    change size instead of the whole corpus size. And no refresh is required.
+
+    ### Usage.
+
+    >>> full_search_service = IncrementalSearchService(
+    ...     'full_search_service_table',
+    ...     select(User.name, User.email, Article.title, Article.body).join(Article, isouter=True),
+    ...     Base.metadata,
+    ... )
+
+    >>> result = await session.execute(full_search_service('some term we want to find'))
+
+    Search table holds selected columns and primary keys of every selected table (as `<table>_<column>` columns).
+    Every search row belongs to the row of the first selected table (root). On changes of any selected table search rows
+    of related root rows are deleted and selected again. Therefore all selected tables must have single column primary
+    key. Concurrent rewrites of the same root row are serialized, and unique `key_index` on `<table>_<column>` columns
+    guards against duplicated search rows. Note, `TRUNCATE` of selected tables is not tracked, call `rebuild` after it.
+
+    ### Migrations:
+
+    Search table, trigger functions and triggers will be created on `Base.metadata.create_all`. Search table is filled
+    by current depending tables state at that moment.
+    For alembic migration raw SQL might be used (compile `CreateSyncFunction` and `CreateSyncTrigger` constructs).
+    """
+
+    def __init__(
+        self,
+        name: str,
+        selectable: Select,
+        metadata: MetaData,
+        *,
+        filter_columns: Sequence[str] = (),
+        init_index: str | bool = False,
+        **kwargs: Any,
+    ) -> None:
+        """
+        `filter_columns`: Names of search table columns usually filtered by, like `'authors_id'`. They are not searched.
+        `kwargs`: Options of `FuzzySearchService`.
+        """
+        sources = source_tables(selectable)
+        self.sources = tuple(sources)
+        self.selectable = with_row_identity(selectable)
+        self.table = Table(
+            name,
+            metadata,
+            Column('id', BigInteger, Identity(), primary_key=True),
+            *(Column(column.name, column.type) for column in selectable.selected_columns),
+            *(Column(row_identity_key(source), source.primary_key.columns[0].type, index=True) for source in sources),
+        )
+        super().__init__(
+            *(self.table.c[column.name] for column in selectable.selected_columns if column.name not in filter_columns),
+            filter_columns=[self.table.c[column] for column in filter_columns],
+            init_index=f'{name}_trgm_idx' if init_index is True else init_index,
+            **kwargs,
+        )
+
+        # keys of outer joined tables could be NULL, which are distinct for unique index
+        self.key_index = Index(
+            f'{name}_key_idx',
+            *(func.coalesce(cast(self.table.c[row_identity_key(source)], Text), '') for source in sources),
+            unique=True,
+        )
+
+        event.listen(metadata, 'after_create', self._after_create)
+
+        root_key = self.table.c[row_identity_key(sources[0])]
+        for source in sources:
+            function = f'{name}__sync_{source.name}'
+            event.listen(
+                metadata,
+                'after_create',
+                CreateSyncFunction(
+                    function,
+                    self.table,
+                    self.selectable,
+                    source_pk=source.primary_key.columns[0],
+                    source_key=self.table.c[row_identity_key(source)],
+                    root_key=root_key,
+                ),
+            )
+            trigger_events: tuple[TriggerEvent, ...] = ('INSERT', 'UPDATE', 'DELETE')
+            for trigger_event in trigger_events:
+                event.listen(metadata, 'after_create', CreateSyncTrigger(function, source, trigger_event))
+            event.listen(metadata, 'before_drop', DropSyncFunction(function))
+
+    @property
+    def source_key_columns(self) -> tuple[Column, ...]:
+        # `id` identifies search rows for pagination only
+        return tuple(self.table.c[row_identity_key(source)] for source in self.sources)
+
+    def source_key(self, table: Table) -> Column:
+        if table not in self.sources:
+            raise ValueError(f'Table {table.name} is not selected by the service. ')
+        return self.table.c[row_identity_key(table)]
+
+    def _after_create(self, target: MetaData, connection: Connection, **kw) -> None:
+        connection.execute(self.populate)
+
+    @property
+    def populate(self) -> Insert:
+        """
+        Statement inserting search rows for the whole depending tables state.
+        """
+        names = [column.name for column in self.selectable.selected_columns]
+        return self.table.insert().from_select(names, self.selectable)
+
+    async def rebuild(self, session: AsyncSession) -> None:
+        """
+        Rewrite the whole search table by depending tables state. Not required on regular tables changes.
+        Cached search results are invalidated once session transaction is committed.
+        """
+        await session.flush()
+        await session.execute(delete(self.table))
+        await session.execute(self.populate)
+        invalidate_on_commit(session, self)
+
+
+class HybridSearchService(FuzzySearchService):
+    """
+    Unlike `FuzzySearchService` rank matches by Postgres full text search, and use trigrams only as fuzzy fallback for
+    misspelled terms. Useful for long texts, where trigram similarity is diluted and whole table filtering by `%`
+    operator gets expensive, while stemmed lexemes are matched by small GIN index.
+
+    ### Usage.
+
+    >>> hybrid_search = HybridSearchService(
+    ...     Article.title,
+    ...     documents=(Article.title, Article.body),
+    ...     init_index='articles_hybrid_idx',
+    ... )
+    >>> result = await session.execute(hybrid_search('some term we want to find'))
+
+    Stored generated `tsvector` column of `documents` (named `vector_column`) is added to the table and indexed by GIN.
+    Columns passed positionally (short ones, like titles or names) are searched by trigrams as `FuzzySearchService`
+    does.
+
+    Search selects bounded candidate set: top `candidates` full text matches by `websearch_to_tsquery` (ranked by
+    `ts_rank_cd`) united with top `candidates` trigram matches. Only candidates are ranked by single combined score:
+
+        text_weight * ts_rank_cd / (ts_rank_cd + 1) + (1 - text_weight) * similarity
+
+    Both addends are in `[0, 1]` range, so score is labeled as `similarity_ratio` and paginated as usual.
+
+    ### Migrations:
+
+    Generated column and indexes will be created on `Base.metadata.create_all`. For alembic migration add column
+    by `op.add_column(table, hybrid_search.vector)` and create indexes like `FuzzySearchService` docs say.
+    """
+
+    def __init__(
+        self,
+        *on_columns: Column[str] | InstrumentedAttribute[str] | Column[str | None] | InstrumentedAttribute[str | None],
+        documents: Sequence[
+            Column[str] | InstrumentedAttribute[str] | Column[str | None] | InstrumentedAttribute[str | None]
+        ],
+        config: str = 'english',
+        vector_column: str = 'search_vector',
+        candidates: int = 100,
+        text_weight: float = 0.5,
+        init_index: str | bool = False,
+        **kwargs: Any,
+    ) -> None:
+        """
+        `kwargs`: Options of `FuzzySearchService`.
+        """
+        super().__init__(*on_columns, init_index=init_index, **kwargs)
+        if not documents:
+            raise ValueError('No document columns. ')
+        if {column.table for column in documents} != self._entities:
+            raise ValueError('Document columns must belong to the table of searched columns. ')
+        if not 0 <= text_weight <= 1:
+            raise ValueError('Text weight must be in [0, 1] range. ')
+        if candidates <= 0:
+            raise ValueError('Candidates amount must be positive. ')
+        if len(self.key_columns) != 1:
+            raise ValueError('HybridSearchService requires single column primary key. ')
+
+        self.config = config
+        self.candidates = candidates
+        self.text_weight = text_weight
+        self.documents = tuple(documents)
+
+        (table,) = self._entities
+        # words of different columns are separated, so they never produce false lexemes at columns boundaries
+        document = self.join_columns(*self.documents)
+        self.vector = Column(
+            vector_column,
+            TSVECTOR,
+            Computed(func.to_tsvector(self.regconfig, document), persisted=True),
+            info={GENERATED_SEARCH_COLUMN: True},
+        )
+        table.append_column(self.vector)
+
+        if init_index:
+            self.vector_index = Index(
+                f'{init_index}_{vector_column}' if isinstance(init_index, str) else None,
+                self.vector,
+                postgresql_using='gin',
+            )
+            self.indexes.append(self.vector_index)
+
+    @property
+    def regconfig(self) -> ColumnElement:
+        # rendered inline at generated column definition, which requires immutable expression
+        return cast(literal(self.config, Text), REGCONFIG)
+
+    @property
+    def cache_namespace(self) -> str:
+        return f'{super().cache_namespace}+{self.vector.name}[{self.text_weight}]'
+
+    def _build_statement(
+        self,
+        term: ColumnElement[str],
+        *,
+        order: bool,
+        include_similarity_ratio: bool,
+        limit: bool,
+        after: bool,
+        knn: bool,
+        mode: SearchMode | None,
+        prefix: bool = False,
+        filters: Sequence[str] = (),
+    ) -> Select:
+        mode = mode or self.mode
+        if mode not in SEARCH_MODES:
+            raise ValueError(f'Unsupported search mode: {mode}. ')
+        similarity_ratio, match, distance = self._match(term, SEARCH_MODES[mode], knn=knn, prefix=prefix)
+
+        (table,) = self._entities
+        (key,) = self.key_columns
+        query = func.websearch_to_tsquery(self.regconfig, term)
+        # rank is normalized to `rank / (rank + 1)`, so it is comparable with similarity ratio
+        text_rank = func.ts_rank_cd(self.vector, query, 32, type_=Float)
+        # candidates are selected from their own table scan, only outer term (of batch search) is correlated
+        conditions = self._filter(filters)
+        text_candidates = (
+            select(key)
+            .where(self.vector.bool_op('@@')(query), *conditions)
+            .order_by(text_rank.desc())
+            .limit(self.candidates)
+            .correlate_except(table)
+        )
+        fuzzy_candidates = (
+            select(key)
+            .where(match, *conditions)
+            .order_by(distance if knn else similarity_ratio.desc())
+            .limit(self.candidates)
+            .correlate_except(table)
+        )
+        score = self.text_weight * text_rank + (1 - self.text_weight) * similarity_ratio
+
+        entities: list[Any] = result_columns(table)
+        if include_similarity_ratio:
+            entities.append(score.label('similarity_ratio'))
+
+        return self._paginate(
+            select(*entities).where(or_(key.in_(text_candidates), key.in_(fuzzy_candidates))),
+            score,
+            order=order,
+            limit=limit,
+            after=after,
+        )
@@ -0,0 +1,66 @@
+"""
+Query terms preprocessing. `pg_trgm` ignores case and non-alphanumeric characters (they separate words), but very
+short terms produce too few trigrams and match almost everything, while very long pasted terms produce hundreds of
+trigrams diluting similarity ratio. Both dominate the slowest queries.
+"""
+import re
+from typing import TYPE_CHECKING, NamedTuple
+
+if TYPE_CHECKING:
+    from services.search_service import SearchMode
+
+_SEPARATORS = re.compile(r'[\W_]+')
+
+
+def normalize_term(term: str, *, max_length: int | None = None) -> str:
+    """
+    Lowercase `term`, collapse punctuation and whitespaces into single spaces and cut it to `max_length` characters at
+    word boundary (if any). Trigrams of normalized term are the same, as `pg_trgm` drops punctuation anyway. Term is
+    lowercased as Postgres `lower()` does (not casefolded: `'ß'` is kept), so it still matches stored text.
+
+    >>> normalize_term('  Full-Text   SEARCH!!! ')
+    'full text search'
+    """
+    term = ' '.join(_SEPARATORS.sub(' ', term.lower()).split())
+    if max_length is None or len(term) <= max_length:
+        return term
+    cut = term[:max_length]
+    if term[max_length] != ' ' and ' ' in cut:
+        cut = cut.rsplit(' ', 1)[0]
+    return cut.rstrip()
+
+
+class RoutedTerm(NamedTuple):
+    """
+    Normalized term and the way it is searched: by search `mode` or by prefix when `prefix` is set.
+    """
+
+    term: str
+    mode: 'SearchMode'
+    prefix: bool = False
+
+
+class TermPolicy(NamedTuple):
+    """
+    Normalize query terms and route them by length.
+
+    `prefix_length`: Terms of at most that many characters are searched by prefix (`ILIKE 'term%'`) instead of
+        similarity. Prefix of every searched column is matched, served by trigram indexes of columns (see
+        `init_index` of search service), as the beginning of text is a word boundary.
+    `word_length`: Terms longer than that many characters are searched by `word_mode` when service mode is
+        `'similarity'`, so match ratio is not diluted by extra words of the term.
+    `max_length`: Terms are cut to that many characters.
+    """
+
+    prefix_length: int = 2
+    word_length: int = 48
+    max_length: int = 256
+    word_mode: 'SearchMode' = 'word_similarity'
+
+    def route(self, term: str, mode: 'SearchMode') -> RoutedTerm:
+        term = normalize_term(term, max_length=self.max_length)
+        if 0 < len(term) <= self.prefix_length:
+            return RoutedTerm(term, mode, prefix=True)
+        if len(term) > self.word_length and mode == 'similarity':
+            return RoutedTerm(term, self.word_mode)
+        return RoutedTerm(term, mode)
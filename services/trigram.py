@@ -0,0 +1,328 @@
+"""
+In-process trigram search mirroring `pg_trgm` Postgres extension semantics.
+"""
+import heapq
+import re
+import struct
+from array import array
+from collections import Counter, namedtuple
+from itertools import chain
+from typing import Any, Iterable, Sequence
+
+from sqlalchemy import Column, Table, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import InstrumentedAttribute
+
+from services.search_service import SEARCH_MODES, SearchCursor, SearchMode, result_columns
+
+# word is a sequence of alphanumeric characters, as `pg_trgm` is built with KEEPONLYALNUM
+_WORD = re.compile(r'[^\W_]+')
+_FLOAT4 = struct.Struct('f')
+
+
+def _float4(value: float) -> float:
+    # `pg_trgm` ratios are `real`, so thresholds are compared exactly as Postgres does
+    return _FLOAT4.unpack(_FLOAT4.pack(value))[0]
+
+
+def positional_trigrams(text: str) -> list[tuple[str, bool, bool]]:
+    """
+    Trigrams of every word of `text` in order (with repeats), flagged whether trigram is the first or the last of word.
+    Words are lowercased and padded by two spaces in front and one behind: `'word'` -> `'  word '`.
+    """
+    result = []
+    for word in _WORD.findall(text.lower()):
+        padded = f'  {word} '
+        last = len(padded) - 3
+        for idx, chars in enumerate(zip(padded, padded[1:], padded[2:])):
+            result.append((''.join(chars), idx == 0, idx == last))
+    return result
+
+
+def trigrams(text: str) -> set[str]:
+    """
+    Set of `text` trigrams. The same as `show_trgm(text)` returns.
+    """
+    return {trigram for trigram, _, _ in positional_trigrams(text)}
+
+
+def _ratio(count: int, term_size: int, extent_size: int) -> float:
+    return count / (term_size + extent_size - count)
+
+
+def similarity(first: str, second: str) -> float:
+    """
+    Ratio of shared trigrams to all trigrams of both strings. The same as `similarity(first, second)`.
+    """
+    first_trigrams, second_trigrams = trigrams(first), trigrams(second)
+    if not first_trigrams or not second_trigrams:
+        return 0.0
+    return _float4(_ratio(len(first_trigrams & second_trigrams), len(first_trigrams), len(second_trigrams)))
+
+
+def _word_similarity(term: str, text: str, *, strict: bool) -> float:
+    # port of `iterate_word_similarity` of `pg_trgm`: extents of text trigrams are enumerated by upper bound,
+    # lower bound is moved forward while it increases similarity
+    term_trigrams = trigrams(term)
+    text_trigrams = positional_trigrams(text)
+    if not term_trigrams or not text_trigrams:
+        return 0.0
+
+    term_size = len(term_trigrams)
+    last_positions: dict[str, int] = {}
+    lower = 0 if strict else -1
+    count = extent_size = 0
+    best = 0.0
+    for upper, (trigram, _, is_word_end) in enumerate(text_trigrams):
+        found = trigram in term_trigrams
+        if lower >= 0 or found:
+            if trigram not in last_positions:
+                extent_size += 1
+                count += found
+            last_positions[trigram] = upper
+
+        # strict extent must end at word boundary, otherwise it ends at any trigram of term
+        if not (is_word_end if strict else found):
+            continue
+        if lower == -1:
+            lower = upper
+            extent_size = 1
+
+        current = _ratio(count, term_size, extent_size)
+        previous_lower = lower
+        moved_count, moved_size = count, extent_size
+        for moved_lower in range(lower, upper + 1):
+            if not strict or text_trigrams[moved_lower][1]:
+                moved = _ratio(moved_count, term_size, moved_size)
+                if moved > current:
+                    current, lower, count, extent_size = moved, moved_lower, moved_count, moved_size
+            moved_trigram = text_trigrams[moved_lower][0]
+            if last_positions.get(moved_trigram) == moved_lower:
+                moved_size -= 1
+                moved_count -= moved_trigram in term_trigrams
+        best = max(best, current)
+
+        for dropped in range(previous_lower, lower):
+            dropped_trigram = text_trigrams[dropped][0]
+            if last_positions.get(dropped_trigram) == dropped:
+                del last_positions[dropped_trigram]
+
+    return _float4(best)
+
+
+def word_similarity(term: str, text: str) -> float:
+    """
+    Greatest similarity of `term` and any continuous extent of `text`. The same as `word_similarity(term, text)`.
+    """
+    return _word_similarity(term, text, strict=False)
+
+
+def strict_word_similarity(term: str, text: str) -> float:
+    """
+    The same as `word_similarity`, but extent boundaries must match word boundaries.
+    The same as `strict_word_similarity(term, text)`.
+    """
+    return _word_similarity(term, text, strict=True)
+
+
+WORD_SIMILARITY_FUNCTIONS = {
+    'word_similarity': word_similarity,
+    'strict_word_similarity': strict_word_similarity,
+}
+
+
+class InMemorySearchService:
+    """
+    Search service by Trigrams at process memory. Results, ratios and thresholds are the same as `FuzzySearchService`
+    ones, but no database round trip is made. Useful for small, rarely changed tables searched on hot paths, and for
+    tests without database.
+
+    ### Usage:
+
+    >>> authors_search = InMemorySearchService(Author.username, similarity_limit=0.1)
+    >>> await authors_search.load(session)  # or `authors_search.build(rows)`
+    ...
+    >>> result = authors_search('some term we want to find', include_similarity_ratio=True, limit=20)
+
+    Index is a snapshot: call `load` again after table changes.
+
+    ### Storage
+
+    Every distinct trigram gets integer id. Postings of every trigram are `array` of row positions, so memory is
+    about 4 bytes per trigram occurrence. Term trigram postings are merged by counting shared trigrams per row: it gives
+    `similarity` of every candidate row straight away, and bounds word similarity (`count / term trigrams`), so exact
+    word similarity is computed only for candidates which could pass the threshold.
+    """
+
+    def __init__(
+        self,
+        *on_columns: Column[str] | InstrumentedAttribute[str] | Column[str | None] | InstrumentedAttribute[str | None],
+        similarity_limit: float | None = None,
+        word_similarity_limit: float | None = None,
+        strict_word_similarity_limit: float | None = None,
+        mode: SearchMode = 'similarity',
+    ) -> None:
+        entities: set[Table] = {column.table for column in on_columns}
+        if len(entities) != 1:
+            raise ValueError('InMemorySearchService supports querying only through *ONE* table. ')
+        if mode not in SEARCH_MODES:
+            raise ValueError(f'Unsupported search mode: {mode}. ')
+
+        (self.table,) = entities
+        self._columns = on_columns
+        self._similarity_limit = similarity_limit
+        self._word_similarity_limit = word_similarity_limit
+        self._strict_word_similarity_limit = strict_word_similarity_limit
+        self.mode = mode
+
+        self._set_row_types()
+        self._trigram_ids: dict[str, int] = {}
+        self._postings: list[array] = []
+        self._sizes = array('I')
+        self._texts: list[str] = []
+        self._rows: list[tuple] = []
+        self._keys: list[tuple] = []
+
+    @property
+    def columns(self):
+        return self._columns
+
+    @property
+    def key_columns(self) -> tuple[Column, ...]:
+        return tuple(self.table.primary_key.columns)
+
+    @property
+    def similarity_limits(self) -> dict[str, float]:
+        """
+        Configured thresholds by search mode.
+        """
+        limits = {
+            'similarity': self._similarity_limit,
+            'word_similarity': self._word_similarity_limit,
+            'strict_word_similarity': self._strict_word_similarity_limit,
+        }
+        return {mode: limit for mode, limit in limits.items() if limit is not None}
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def _set_row_types(self) -> None:
+        # the same columns as `FuzzySearchService` selects, generated columns of search services are skipped
+        self._result_columns = result_columns(self.table)
+        names = [column.key for column in self._result_columns]
+        self._row_type = namedtuple('SearchRow', names, rename=True)  # type: ignore[misc]
+        self._ratio_row_type = namedtuple('SearchRow', [*names, 'similarity_ratio'], rename=True)  # type: ignore[misc]
+
+    async def load(self, session: AsyncSession) -> None:
+        """
+        Build index by current table rows.
+        """
+        self.build(await session.execute(select(*result_columns(self.table))))
+
+    def build(self, rows: Iterable[Any]) -> None:
+        """
+        Build index by `rows`: objects with table columns attributes (result rows, ORM instances, named tuples).
+        """
+        self._set_row_types()
+        trigram_ids: dict[str, int] = {}
+        postings: list[array] = []
+        sizes = array('I')
+        texts, stored, keys = [], [], []
+        for position, row in enumerate(rows):
+            # columns are concatenated the same way as `FuzzySearchService.concat_columns` does
+            text = ''.join(getattr(row, column.key) or '' for column in self.columns)
+            row_trigrams = trigrams(text)
+            for trigram in row_trigrams:
+                if trigram not in trigram_ids:
+                    trigram_ids[trigram] = len(postings)
+                    postings.append(array('I'))
+                postings[trigram_ids[trigram]].append(position)
+            sizes.append(len(row_trigrams))
+            texts.append(text)
+            stored.append(tuple(getattr(row, column.key) for column in self._result_columns))
+            keys.append(tuple(getattr(row, column.key) for column in self.key_columns))
+
+        self._trigram_ids, self._postings, self._sizes = trigram_ids, postings, sizes
+        self._texts, self._rows, self._keys = texts, stored, keys
+
+    def cursor(self, row: Any) -> SearchCursor:
+        """
+        Get keyset pagination position from the last fetched row.
+        Row must be selected with `include_similarity_ratio=True`.
+        """
+        return SearchCursor(row.similarity_ratio, tuple(getattr(row, column.key) for column in self.key_columns))
+
+    def __call__(
+        self,
+        term: str,
+        *,
+        order: bool = True,
+        include_similarity_ratio: bool = False,
+        limit: int | None = None,
+        after: SearchCursor | None = None,
+        knn: bool = False,
+        mode: SearchMode | None = None,
+    ) -> list[Any]:
+        """
+        Search `term` string. Params are the same as `FuzzySearchService` ones, but matched rows are returned instead of
+        statement. `knn` ordering gives the same results as ordering by ratio, so it is accepted for compatibility only.
+        """
+        mode = mode or self.mode
+        if mode not in SEARCH_MODES:
+            raise ValueError(f'Unsupported search mode: {mode}. ')
+        if (limit is not None or after is not None) and not order:
+            raise ValueError('Pagination requires ordered results. ')
+
+        matches = [
+            (ratio, self._keys[position], position)
+            for position, ratio in self._match(term, mode)
+            if after is None or (ratio, self._keys[position]) < (after.similarity_ratio, after.key)
+        ]
+        if order and limit is not None:
+            matches = heapq.nlargest(limit, matches)
+        elif order:
+            matches.sort(reverse=True)
+        else:
+            matches.sort(key=lambda match: match[2])
+
+        if include_similarity_ratio:
+            return [self._ratio_row_type(*self._rows[position], ratio) for ratio, _, position in matches]
+        return [self._row_type(*self._rows[position]) for _, _, position in matches]
+
+    def search_many(
+        self,
+        terms: Sequence[str],
+        *,
+        per_term_limit: int = 10,
+        knn: bool = False,
+        mode: SearchMode | None = None,
+    ) -> dict[str, list[Any]]:
+        """
+        Search every term of `terms`. Return matches with `similarity_ratio` grouped by term.
+        """
+        return {
+            term: self(term, include_similarity_ratio=True, limit=per_term_limit, knn=knn, mode=mode) for term in terms
+        }
+
+    def _match(self, term: str, mode: str) -> Iterable[tuple[int, float]]:
+        """
+        Positions and ratios of rows matching `term` by threshold of `mode`.
+        """
+        term_trigrams = trigrams(term)
+        if not term_trigrams:
+            return
+
+        threshold = self.similarity_limits.get(mode, SEARCH_MODES[mode].default_limit)
+        term_size = len(term_trigrams)
+        term_ids = [self._trigram_ids[trigram] for trigram in term_trigrams if trigram in self._trigram_ids]
+        shared = Counter(chain.from_iterable(self._postings[trigram_id] for trigram_id in term_ids))
+
+        for position, count in shared.items():
+            if mode == 'similarity':
+                ratio = _float4(_ratio(count, term_size, self._sizes[position]))
+            elif _float4(count / term_size) >= threshold:
+                ratio = WORD_SIMILARITY_FUNCTIONS[mode](term, self._texts[position])
+            else:
+                continue  # word similarity never exceeds shared part of term trigrams
+            if ratio >= threshold:
+                yield position, ratio
@@ -23,6 +23,14 @@ class Settings(BaseSettings):
     SQL_LOGS: bool = False
     SQL_POOL_LOGS: bool = False
 
+    # Search traffic engine. Read replica host and port, primary database by default.
+    SEARCH_POSTGRES_HOST: str | None = None
+    SEARCH_POSTGRES_PORT: int | None = None
+    SEARCH_POOL_SIZE: int = 5
+    SEARCH_MAX_OVERFLOW: int = 10
+    SEARCH_STATEMENT_TIMEOUT: int = 5000  # milliseconds
+    SEARCH_WORK_MEM: str = '64MB'
+
     @property
     def DATABASE_URL(self) -> URL:  # noqa: N802
         return URL.create(
@@ -34,6 +42,13 @@ class Settings(BaseSettings):
             database=self.POSTGRES_DB,
         )
 
+    @property
+    def SEARCH_DATABASE_URL(self) -> URL:  # noqa: N802
+        return self.DATABASE_URL.set(
+            host=self.SEARCH_POSTGRES_HOST or self.POSTGRES_HOST,
+            port=self.SEARCH_POSTGRES_PORT or self.POSTGRES_PORT,
+        )
+
     def __str__(self) -> str:
         return pformat(self.dict())
 
@@ -0,0 +1,76 @@
+"""
+Benchmarks run against Postgres of test settings on generated corpus. They are opt-in:
+
+    pytest -m benchmark
+
+`BENCHMARK_ROWS`: Amount of generated articles (`10000` by default, up to `10000000` is reasonable).
+`BENCHMARK_QUERIES`: Amount of measured queries for every case (`50` by default).
+`BENCHMARK_REPORT`: Path of JSON report (`.pytest_cache/benchmark_report.json` by default, out of version control).
+"""
+import json
+import platform
+import time
+from datetime import datetime, timezone
+from typing import Any
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+from models import Base, full_search
+from tests.benchmarks.corpus import generate_corpus, vocabulary
+from tests.benchmarks.utils import BENCHMARK_QUERIES, BENCHMARK_REPORT, BENCHMARK_ROWS
+
+
+@pytest.fixture(scope='session')
+def report():
+    """
+    Benchmark results collected by tests and written to JSON report at the end of session. Reports of the same
+    `BENCHMARK_ROWS` and `BENCHMARK_QUERIES` are comparable across runs.
+    """
+    report: dict[str, Any] = {
+        'created': datetime.now(timezone.utc).isoformat(),
+        'python': platform.python_version(),
+        'rows': BENCHMARK_ROWS,
+        'queries': BENCHMARK_QUERIES,
+        'results': [],
+    }
+    yield report
+    BENCHMARK_REPORT.parent.mkdir(parents=True, exist_ok=True)
+    BENCHMARK_REPORT.write_text(json.dumps(report, indent=2))
+
+
+@pytest.fixture(scope='session')
+def words() -> list[str]:
+    return vocabulary()
+
+
+@pytest.fixture(scope='module')
+async def corpus(engine: AsyncEngine, setup_database: None, report: dict[str, Any], words: list[str]):
+    """
+    Tables filled by generated corpus. Materialized view refresh time is reported.
+    """
+    async with engine.begin() as connection:
+        await connection.execute(text('CREATE EXTENSION IF NOT EXISTS "uuid-ossp"'))
+        await connection.execute(text('CREATE EXTENSION IF NOT EXISTS pg_trgm'))
+        await connection.execute(text('CREATE EXTENSION IF NOT EXISTS btree_gin'))
+        await connection.run_sync(Base.metadata.create_all)
+        report['postgres'] = (await connection.execute(text('SHOW server_version'))).scalar()
+
+    started = time.perf_counter()
+    async with engine.begin() as connection:
+        await generate_corpus(connection, articles=BENCHMARK_ROWS, words=words)
+    report['results'].append({'case': 'generate_corpus', 'seconds': time.perf_counter() - started})
+
+    for concurrently in (False, True):
+        started = time.perf_counter()
+        async with AsyncSession(engine) as session, session.begin():
+            await full_search.refresh(session, concurrently=concurrently)
+        report['results'].append(
+            {'case': 'refresh', 'concurrently': concurrently, 'seconds': time.perf_counter() - started}
+        )
+
+    yield
+
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.drop_all)
@@ -0,0 +1,76 @@
+"""
+Synthetic Authors and Articles corpus. Texts are generated by Postgres itself, so loading 10^7 rows takes a couple of
+statements instead of millions of round trips.
+"""
+import random
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+SYLLABLES = [
+    'ka', 'lo', 'mi', 'ne', 'ru', 'sa', 'ti', 'vo', 'ze', 'ba', 'do', 'fi', 'gu', 'ha', 'je', 'pe', 'qua', 'ri', 'sho',
+    'tra', 'ul', 'an', 'es', 'or', 'in', 'str', 'ch', 'th', 'gre', 'pla',
+]  # fmt: skip
+
+
+def vocabulary(size: int = 5000, seed: int = 42) -> list[str]:
+    """
+    Pseudo words of 2-4 syllables. The same `seed` gives the same words.
+    """
+    rnd = random.Random(seed)
+    words: set[str] = set()
+    while len(words) < size:
+        words.add(''.join(rnd.choice(SYLLABLES) for _ in range(rnd.randint(2, 4))))
+    return sorted(words)
+
+
+def terms(words: list[str], *, amount: int, length: int, seed: int = 42) -> list[str]:
+    """
+    Search terms of `length` random words.
+    """
+    rnd = random.Random(seed + length)
+    return [' '.join(rnd.choice(words) for _ in range(length)) for _ in range(amount)]
+
+
+def _sentence(min_words: int, max_words: int) -> str:
+    # correlated by `g`, so a new sentence is generated for every row
+    return f'''(
+        SELECT string_agg(v.words[1 + floor(random() * array_length(v.words, 1))::int], ' ')
+        FROM generate_series(1, {min_words} + g % {max_words - min_words + 1})
+    )'''
+
+
+async def generate_corpus(connection: AsyncConnection, *, articles: int, words: list[str], seed: float = 0.42) -> None:
+    """
+    Insert `articles` articles of `articles // 10` authors. Every tenth article has no body.
+    """
+    authors = max(1, articles // 10)
+    await connection.execute(text('SELECT setseed(:seed)'), {'seed': seed})
+    await connection.execute(
+        text(
+            f'''
+            INSERT INTO authors (id, username, first_name, last_name)
+            SELECT uuid_generate_v4(), {_sentence(1, 2)} || ' ' || g, {_sentence(1, 1)}, {_sentence(1, 1)}
+            FROM generate_series(1, :authors) AS g, (SELECT CAST(:words AS TEXT[]) AS words) AS v
+            '''
+        ),
+        {'authors': authors, 'words': words},
+    )
+    await connection.execute(
+        text(
+            f'''
+            INSERT INTO articles (id, title, body, author_id)
+            SELECT
+                uuid_generate_v4(),
+                {_sentence(3, 8)},
+                CASE WHEN g % 10 = 0 THEN NULL ELSE {_sentence(20, 80)} END,
+                a.id
+            FROM generate_series(1, :articles) AS g
+            JOIN (SELECT id, row_number() OVER (ORDER BY id) - 1 AS n FROM authors) AS a ON a.n = g % :authors
+            CROSS JOIN (SELECT CAST(:words AS TEXT[]) AS words) AS v
+            '''
+        ),
+        {'articles': articles, 'authors': authors, 'words': words},
+    )
+    await connection.execute(text('ANALYZE authors'))
+    await connection.execute(text('ANALYZE articles'))
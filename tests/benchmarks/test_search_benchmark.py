@@ -0,0 +1,78 @@
+"""
+Benchmark search latency and throughput by search mode, term length and threshold.
+"""
+
+from typing import Any
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+from models import full_search
+from models.models import ArticleModel, articles_search
+from services.explain import explain
+from services.search_service import FuzzySearchService
+from tests.benchmarks.corpus import terms
+from tests.benchmarks.utils import BENCHMARK_QUERIES, measure
+
+pytestmark = [pytest.mark.anyio, pytest.mark.benchmark]
+
+MODES = ['similarity', 'word_similarity', 'strict_word_similarity']
+
+
+@pytest.mark.parametrize('mode', MODES)
+async def test_trigram_index_used(corpus: None, engine: AsyncEngine, words: list[str], mode: str):
+    async with AsyncSession(engine) as session, session.begin():
+        await articles_search.set_similarity_limit(session)
+        statement = articles_search(terms(words, amount=1, length=2)[0], mode=mode, limit=20)
+        plan = '\n'.join((await session.execute(explain(statement))).scalars())
+
+    assert articles_search.index is not None
+    assert articles_search.index.name in plan, plan
+
+
+@pytest.mark.parametrize('threshold', [0.1, 0.3, 0.6])
+@pytest.mark.parametrize('term_length', [1, 2, 4])
+@pytest.mark.parametrize('mode', MODES)
+async def test_search_benchmark(
+    corpus: None,
+    engine: AsyncEngine,
+    report: dict[str, Any],
+    words: list[str],
+    mode: str,
+    term_length: int,
+    threshold: float,
+):
+    # the same indexed expression as `articles_search` has, so its index is used
+    search = FuzzySearchService(
+        ArticleModel.title,
+        ArticleModel.body,
+        similarity_limit=threshold,
+        word_similarity_limit=threshold,
+        strict_word_similarity_limit=threshold,
+    )
+    async with AsyncSession(engine) as session, session.begin():
+        await search.set_similarity_limit(session)
+
+        async def query(term: str):
+            return (await session.execute(search(term, mode=mode, include_similarity_ratio=True, limit=20))).all()
+
+        result = await measure(query, terms(words, amount=BENCHMARK_QUERIES, length=term_length))
+
+    report['results'].append(
+        {'case': 'articles_search', 'mode': mode, 'term_length': term_length, 'threshold': threshold, **result}
+    )
+
+
+@pytest.mark.parametrize('term_length', [1, 2])
+async def test_full_search_benchmark(
+    corpus: None, engine: AsyncEngine, report: dict[str, Any], words: list[str], term_length: int
+):
+    async with AsyncSession(engine) as session, session.begin():
+        await full_search.set_similarity_limit(session, 0.3)
+
+        async def query(term: str):
+            return (await session.execute(full_search(term, include_similarity_ratio=True, limit=20))).all()
+
+        result = await measure(query, terms(words, amount=BENCHMARK_QUERIES, length=term_length))
+
+    report['results'].append({'case': 'full_search', 'term_length': term_length, 'threshold': 0.3, **result})
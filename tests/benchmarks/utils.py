@@ -0,0 +1,31 @@
+import os
+import statistics
+import time
+from pathlib import Path
+from typing import Any, Awaitable, Callable
+
+BENCHMARK_ROWS = int(os.environ.get('BENCHMARK_ROWS', 10_000))
+BENCHMARK_QUERIES = int(os.environ.get('BENCHMARK_QUERIES', 50))
+BENCHMARK_REPORT = Path(os.environ.get('BENCHMARK_REPORT', '.pytest_cache/benchmark_report.json'))
+
+
+async def measure(query: Callable[[str], Awaitable[Any]], terms: list[str]) -> dict[str, float]:
+    """
+    Run `query` for every term one by one. Return latency percentiles (milliseconds) and throughput.
+    """
+    latencies = []
+    started = time.perf_counter()
+    for term in terms:
+        query_started = time.perf_counter()
+        await query(term)
+        latencies.append((time.perf_counter() - query_started) * 1000)
+    elapsed = time.perf_counter() - started
+
+    percentiles = statistics.quantiles(latencies, n=100, method='inclusive')
+    return {
+        'p50_ms': percentiles[49],
+        'p95_ms': percentiles[94],
+        'p99_ms': percentiles[98],
+        'max_ms': max(latencies),
+        'throughput_qps': len(terms) / elapsed,
+    }
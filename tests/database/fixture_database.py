@@ -7,6 +7,7 @@ from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
 
 from models import Base
+from services.executor import create_search_engine
 from settings.settings import Settings, logger
 from tests.utils import async_create_database, async_drop_database
 
@@ -16,6 +17,16 @@ def engine(settings: Settings):
     return create_async_engine(settings.DATABASE_URL, echo=settings.SQL_LOGS, echo_pool=settings.SQL_POOL_LOGS)
 
 
+@pytest.fixture(scope='session')
+async def search_engine(settings: Settings):
+    """
+    Search traffic engine. Test settings have no replica, so it is connected to the test database as well.
+    """
+    search_engine = create_search_engine(settings)
+    yield search_engine
+    await search_engine.dispose()
+
+
 @pytest.fixture(scope='session')
 async def setup_database(engine: AsyncEngine):
     """
@@ -58,6 +69,7 @@ def setup_tables(request: pytest.FixtureRequest, engine: AsyncEngine, setup_data
             async with engine.begin() as connection:
                 await connection.execute(text('CREATE EXTENSION IF NOT EXISTS "uuid-ossp"'))
                 await connection.execute(text('CREATE EXTENSION IF NOT EXISTS pg_trgm'))
+                await connection.execute(text('CREATE EXTENSION IF NOT EXISTS btree_gin'))
                 await connection.run_sync(Base.metadata.create_all)
 
         async def _teardown():
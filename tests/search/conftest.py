@@ -3,6 +3,7 @@ from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
 
 from models import full_search
 from models.models import ArticleModel, AuthorModel
+from tests.search.documents import copy_articles
 
 
 @pytest.fixture
@@ -30,3 +31,9 @@ async def seed_database(engine: AsyncEngine, setup_tables: None):
 
     async with AsyncSession(engine) as session, session.begin():
         await full_search.refresh(session)
+
+
+@pytest.fixture
+async def seed_documents(engine: AsyncEngine, seed_database: None):
+    async with AsyncSession(engine) as session, session.begin():
+        await copy_articles(session)
@@ -0,0 +1,81 @@
+"""
+Search services adding generated columns and indexes to their table. They are tested on a copy of articles, so
+`articles` table of the app stays free of generated columns and extra indexes.
+"""
+from sqlalchemy import Column, ForeignKey, Table, Text, Uuid, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from models import Base
+from models.models import AuthorModel
+from services.search_service import (
+    FuzzySearchService,
+    HybridSearchService,
+    IncrementalSearchService,
+    MaterializedSearchService,
+)
+from services.terms import TermPolicy
+
+documents = Table(
+    'search_documents',
+    Base.metadata,
+    Column('id', Uuid, primary_key=True),
+    Column('title', Text, nullable=False),
+    Column('body', Text),
+    Column('author_id', Uuid, ForeignKey(AuthorModel.id), nullable=False),
+)
+
+documents_hybrid_search = HybridSearchService(
+    documents.c.title,
+    documents=(documents.c.title, documents.c.body),
+    init_index='search_documents_hybrid_idx',
+)
+
+documents_text_search = FuzzySearchService(
+    documents.c.title,
+    documents.c.body,
+    search_column=True,
+    init_index='search_documents_text_idx',
+)
+
+documents_author_search = FuzzySearchService(
+    documents.c.title,
+    documents.c.body,
+    similarity_limit=0.01,
+    filter_columns=(documents.c.author_id,),
+    init_index='search_documents_author_idx',
+)
+
+documents_prefix_search = FuzzySearchService(
+    documents.c.title,
+    documents.c.body,
+    term_policy=TermPolicy(prefix_length=2),
+    init_index='search_documents_prefix_idx',
+)
+
+documents_author_query = select(documents.c.title, documents.c.body, documents.c.author_id)
+
+documents_author_view_search = MaterializedSearchService.from_select(
+    'search_documents_author_view',
+    documents_author_query,
+    Base.metadata,
+    similarity_limit=0.01,
+    filter_columns=('author_id',),
+    init_index=True,
+)
+
+documents_author_table_search = IncrementalSearchService(
+    'search_documents_author_table',
+    documents_author_query,
+    Base.metadata,
+    similarity_limit=0.01,
+    filter_columns=('author_id',),
+    init_index=True,
+)
+
+
+async def copy_articles(session: AsyncSession) -> None:
+    await session.execute(
+        text(
+            'INSERT INTO search_documents (id, title, body, author_id) SELECT id, title, body, author_id FROM articles'
+        )
+    )
@@ -0,0 +1,312 @@
+"""
+Test full text search on Articles by FuzzySearchService.
+"""
+
+import pytest
+from sqlalchemy import func, select, text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+from models import full_search
+from models.models import ArticleModel, AuthorModel, articles_search
+from services.explain import explain
+from services.instrumentation import SearchInstrumentation, SearchMetrics
+from services.search_service import FuzzySearchService
+from services.terms import TermPolicy
+from tests.search.documents import (
+    copy_articles,
+    documents_author_search,
+    documents_author_table_search,
+    documents_author_view_search,
+    documents_hybrid_search,
+    documents_prefix_search,
+    documents_text_search,
+)
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_articles_search_pagination(seed_database: None, session: AsyncSession):
+    await articles_search.set_similarity_limit(session)
+
+    result = (
+        await session.execute(articles_search('Full Text Search', include_similarity_ratio=True, limit=100))
+    ).all()
+    assert len(result) > 1
+
+    pages = []
+    cursor = None
+    while page := (
+        await session.execute(articles_search('Full Text Search', include_similarity_ratio=True, limit=1, after=cursor))
+    ).all():
+        pages.extend(page)
+        cursor = articles_search.cursor(page[-1])
+
+    assert pages == result
+
+
+async def test_articles_search_knn(seed_database: None, session: AsyncSession):
+    await articles_search.set_similarity_limit(session)
+
+    result = (
+        await session.execute(articles_search('Full Text Search', include_similarity_ratio=True, limit=100))
+    ).all()
+    knn_result = (
+        await session.execute(articles_search('Full Text Search', include_similarity_ratio=True, limit=100, knn=True))
+    ).all()
+    assert knn_result == result
+
+
+@pytest.mark.parametrize(
+    'mode, term',
+    [
+        ('similarity', 'Full Text Search'),
+        ('word_similarity', 'SQL'),
+        ('strict_word_similarity', 'SQLAlchemy'),
+    ],
+)
+async def test_articles_search_knn_modes(seed_database: None, session: AsyncSession, mode: str, term: str):
+    await articles_search.set_similarity_limit(session)
+
+    result = (await session.execute(articles_search(term, mode=mode, include_similarity_ratio=True, limit=100))).all()
+    knn_result = (
+        await session.execute(articles_search(term, mode=mode, include_similarity_ratio=True, limit=100, knn=True))
+    ).all()
+    assert result
+    assert knn_result == result
+
+
+@pytest.mark.parametrize(
+    'mode, term',
+    [
+        ('word_similarity', 'SQL'),
+        ('strict_word_similarity', 'SQLAlchemy'),
+    ],
+)
+async def test_articles_search_word_similarity(seed_database: None, session: AsyncSession, mode: str, term: str):
+    await articles_search.set_similarity_limit(session)
+
+    result = (await session.execute(articles_search(term, mode=mode, include_similarity_ratio=True))).all()
+    assert [row.body for row in result] == ['Full Text Search in PostgreSQL by SQLAlchemy']
+
+
+async def test_articles_search_transaction_similarity_limit(setup_tables: None, engine: AsyncEngine):
+    query = select(func.show_limit())
+
+    async with AsyncSession(engine) as session, session.begin():
+        await articles_search.set_similarity_limit(session)
+        assert (await session.execute(query)).scalar() == pytest.approx(0.01)
+
+        await full_search.set_similarity_limit(session, 0.2)
+        assert (await session.execute(query)).scalar() == pytest.approx(0.2)
+
+        await articles_search.set_similarity_limit(session)
+        assert (await session.execute(query)).scalar() == pytest.approx(0.01)
+
+    async with AsyncSession(engine) as session, session.begin():
+        assert (await session.execute(query)).scalar() == pytest.approx(0.3)
+
+
+async def test_articles_search_many(seed_database: None, session: AsyncSession):
+    result = await articles_search.search_many(session, ['Full Text Search', 'Imagine', 'Zzz'], per_term_limit=1)
+
+    assert list(result) == ['Full Text Search', 'Imagine', 'Zzz']
+    assert [row.title for row in result['Full Text Search']] == ['Full Text Search. ']
+    assert [row.title for row in result['Imagine']] == ['Imagine']
+    assert result['Zzz'] == []
+
+
+async def test_articles_search_many_order(seed_database: None, session: AsyncSession):
+    await articles_search.set_similarity_limit(session)
+    terms = ['Imagine', 'Full Text Search']
+    rows = (await session.execute(articles_search.batch(terms, per_term_limit=10))).all()
+    assert [row.term for row in rows] == sorted((row.term for row in rows), key=terms.index)
+
+    for term in terms:
+        expected = (await session.execute(articles_search(term, include_similarity_ratio=True, limit=10))).all()
+        assert [row.id for row in rows if row.term == term] == [row.id for row in expected]
+
+
+async def test_articles_search_cached_statement(seed_database: None, session: AsyncSession):
+    await articles_search.set_similarity_limit(session)
+
+    statement = articles_search.statement(include_similarity_ratio=True, limit=True)
+    assert statement is articles_search.statement(include_similarity_ratio=True, limit=True)
+
+    result = (await session.execute(statement, articles_search.parameters('Imagine', limit=10))).all()
+    assert result == (await session.execute(articles_search('Imagine', include_similarity_ratio=True, limit=10))).all()
+
+
+async def test_articles_weighted_search(seed_database: None, session: AsyncSession):
+    weighted_search = FuzzySearchService(ArticleModel.title, ArticleModel.body, weights=(1.0, 0.3))
+
+    result = (await session.execute(weighted_search('Full Text Search', include_similarity_ratio=True))).all()
+    assert [row.body for row in result] == ['Full Text Search in PostgreSQL by SQLAlchemy', '']
+    assert all(0 < row.similarity_ratio <= 1 for row in result)
+
+
+async def test_articles_hybrid_search(seed_documents: None, session: AsyncSession):
+    await documents_hybrid_search.set_similarity_limit(session)
+
+    result = (await session.execute(documents_hybrid_search('text search', include_similarity_ratio=True))).all()
+    assert [row.body for row in result] == ['Full Text Search in PostgreSQL by SQLAlchemy', '']
+    # generated columns of every service on the table are skipped
+    assert not {'search_vector', 'search_text'} & set(result[0]._fields)
+    assert all(0 < row.similarity_ratio <= 1 for row in result)
+
+
+async def test_articles_hybrid_search_fuzzy_fallback(seed_documents: None, session: AsyncSession):
+    await documents_hybrid_search.set_similarity_limit(session)
+
+    # misspelled term has no full text matches
+    result = (await session.execute(documents_hybrid_search('Imagne', include_similarity_ratio=True))).all()
+    assert [row.title for row in result] == ['Imagine']
+    assert 0 < result[0].similarity_ratio <= 0.5
+
+
+async def test_articles_search_instrumentation(seed_database: None, session: AsyncSession):
+    metrics: list[SearchMetrics] = []
+    search = FuzzySearchService(
+        ArticleModel.title,
+        ArticleModel.body,
+        similarity_limit=0.01,
+        instrumentation=SearchInstrumentation(metrics.append, explain_sample_rate=1),
+    )
+
+    rows = await search.fetch(session, 'Imagine', limit=10)
+    await search.search_many(session, ['Imagine', 'Full Text Search'])
+
+    single, batch = metrics
+    assert (single.mode, single.threshold, single.term_length, single.terms) == ('similarity', 0.01, '4-7', 1)
+    assert single.rows == len(rows)
+    assert single.duration > 0
+    assert single.plan and 'articles' in single.plan
+    assert (batch.term_length, batch.terms) == ('16-31', 2)
+
+
+async def test_articles_search_term_policy(seed_database: None, session: AsyncSession):
+    search = FuzzySearchService(ArticleModel.title, ArticleModel.body, term_policy=TermPolicy(word_length=20))
+    await search.set_similarity_limit(session)
+
+    # short term is searched by prefix, not by trigram similarity
+    result = await search.fetch(session, 'IM', limit=10)
+    assert [row.title for row in result] == ['Imagine']
+
+    # punctuation and case do not matter
+    result = await search.fetch(session, '  full-TEXT search!!! ', limit=10)
+    assert {row.title for row in result} == {'Full Text Search. '}
+
+    # long pasted term is searched by word similarity
+    term = 'imagine all the people living for today'
+    assert search.route(term).mode == 'word_similarity'
+    result = await search.fetch(session, term, limit=10)
+    assert [row.title for row in result] == ['Imagine']
+
+
+async def test_articles_search_prefix_every_column(seed_database: None, session: AsyncSession):
+    search = FuzzySearchService(ArticleModel.title, ArticleModel.body, term_policy=TermPolicy(prefix_length=2))
+    session.add(
+        AuthorModel(
+            username='beatles',
+            first_name=None,
+            last_name=None,
+            articles=[ArticleModel(title='Songs', body='Yesterday all my troubles seemed so far away')],
+        )
+    )
+    await session.flush()
+    await search.set_similarity_limit(session)
+
+    result = await search.fetch(session, 'YE', limit=10)
+    assert [row.title for row in result] == ['Songs']
+
+    # only starts of columns are matched
+    assert await search.fetch(session, 'ES', limit=10) == []
+
+
+async def test_articles_search_prefix_index(seed_documents: None, session: AsyncSession):
+    assert [index.name for index in documents_prefix_search.indexes] == [
+        'search_documents_prefix_idx',
+        'search_documents_prefix_idx_title',
+        'search_documents_prefix_idx_body',
+    ]
+    result = await documents_prefix_search.fetch(session, 'IM', limit=10)
+    assert [row.title for row in result] == ['Imagine']
+
+    await session.execute(text('SET LOCAL enable_seqscan = off'))
+    statement = documents_prefix_search.statement(prefix=True)
+    plan = '\n'.join((await session.execute(explain(statement), {'term': 'im'})).scalars())
+    assert 'search_documents_prefix_idx_title' in plan, plan
+    assert 'search_documents_prefix_idx_body' in plan, plan
+
+
+async def test_articles_search_column(seed_documents: None, session: AsyncSession):
+    assert documents_text_search.search_column is not None
+    texts = (await session.execute(select(documents_text_search.search_column))).scalars()
+    assert 'imagine imagine all the people living for today. ' in set(texts)
+
+    await documents_text_search.set_similarity_limit(session, 0.1)
+    result = (await session.execute(documents_text_search('full text search', include_similarity_ratio=True))).all()
+    assert [row.body for row in result] == ['', 'Full Text Search in PostgreSQL by SQLAlchemy']
+    assert not {'search_vector', 'search_text'} & set(result[0]._fields)
+
+
+async def test_articles_search_filters(seed_database: None, session: AsyncSession):
+    author = AuthorModel(
+        username='other', first_name=None, last_name=None, articles=[ArticleModel(title='Imagine', body=None)]
+    )
+    session.add(author)
+    await session.flush()
+    await copy_articles(session)
+    await documents_author_search.set_similarity_limit(session)
+
+    result = (await session.execute(documents_author_search('Imagine', filters={'author_id': author.id}))).all()
+    assert [(row.title, row.author_id) for row in result] == [('Imagine', author.id)]
+
+    grouped = await documents_author_search.search_many(session, ['Imagine'], filters={'author_id': author.id})
+    assert [row.author_id for row in grouped['Imagine']] == [author.id]
+
+    with pytest.raises(ValueError):
+        documents_author_search('Imagine', filters={'unknown': 1})
+
+
+@pytest.mark.parametrize('search', [documents_author_view_search, documents_author_table_search])
+async def test_articles_search_filters_on_search_views(
+    seed_database: None, session: AsyncSession, search: FuzzySearchService
+):
+    author = AuthorModel(
+        username='other', first_name=None, last_name=None, articles=[ArticleModel(title='Imagine', body=None)]
+    )
+    session.add(author)
+    await session.flush()
+    await copy_articles(session)
+    await documents_author_view_search.refresh(session)
+    assert search.index is not None and search.index.expressions[0].name == 'author_id'
+
+    result = await search.fetch(session, 'Imagine', filters={'author_id': author.id})
+    assert [(row.title, row.author_id) for row in result] == [('Imagine', author.id)]
+
+
+async def test_articles_search_hits(seed_database: None, session: AsyncSession):
+    hits = await articles_search.search(session, 'Imagine', limit=1, load=[ArticleModel])
+
+    (hit,) = hits
+    assert hit.fields == {'title': 'Imagine', 'body': 'Imagine all the people living for today. '}
+    assert 0 < hit.score <= 1
+    (article,) = hit.entities
+    assert article.id == hit.keys['id']
+
+    with pytest.raises(ValueError):
+        await articles_search.search(session, 'Imagine', load=[AuthorModel])
+
+
+async def test_articles_search_savepoint_similarity_limit(setup_tables: None, engine: AsyncEngine):
+    query = select(func.show_limit())
+
+    async with AsyncSession(engine) as session, session.begin():
+        await articles_search.set_similarity_limit(session)
+        async with session.begin_nested():
+            await full_search.set_similarity_limit(session, 0.2)
+        # limits of released savepoint outlive it
+        assert (await session.execute(query)).scalar() == pytest.approx(0.2)
+
+        await articles_search.set_similarity_limit(session)
+        assert (await session.execute(query)).scalar() == pytest.approx(0.01)
@@ -0,0 +1,43 @@
+"""
+Test bulk loading by COPY with search indexes rebuild.
+"""
+
+import uuid
+
+import pytest
+from sqlalchemy import select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from models import full_search
+from models.models import ArticleModel, AuthorModel, articles_search
+from services.bulk import BulkLoad
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_bulk_load(setup_tables: None, session: AsyncSession):
+    author_id = uuid.uuid4()
+    async with BulkLoad(session, articles_search, full_search, maintenance_work_mem='64MB') as load:
+        indexes = (
+            await session.execute(text("SELECT indexname FROM pg_indexes WHERE tablename = 'articles'"))
+        ).scalars()
+        assert articles_search.index is not None
+        assert articles_search.index.name not in set(indexes)
+
+        assert await load.copy(AuthorModel.__table__, [(author_id, 'bulk')], columns=['id', 'username']) == 1
+        assert (
+            await load.copy(
+                ArticleModel.__table__,
+                ((uuid.uuid4(), f'Bulk article {idx}', None, author_id) for idx in range(100)),
+                columns=['id', 'title', 'body', 'author_id'],
+            )
+            == 100
+        )
+
+    indexes = (await session.execute(text("SELECT indexname FROM pg_indexes WHERE tablename = 'articles'"))).scalars()
+    assert articles_search.index.name in set(indexes)
+
+    await articles_search.set_similarity_limit(session)
+    assert len((await session.execute(articles_search('Bulk article'))).all()) == 100
+    assert len((await session.execute(full_search('Bulk article'))).all()) == 100
+    assert (await session.execute(select(AuthorModel.username))).scalar() == 'bulk'
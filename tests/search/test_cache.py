@@ -0,0 +1,60 @@
+"""
+Test search results cache.
+"""
+
+import asyncio
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from models import full_search
+from services.cache import InMemorySearchCache
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_in_memory_cache_lru_eviction():
+    cache = InMemorySearchCache(maxsize=2)
+    await cache.set('search:a', [1])
+    await cache.set('search:b', [2])
+    assert await cache.get('search:a') == [1]
+
+    await cache.set('search:c', [3])
+    assert await cache.get('search:b') is None
+    assert await cache.get('search:a') == [1]
+    assert await cache.get('search:c') == [3]
+
+
+async def test_in_memory_cache_ttl():
+    cache = InMemorySearchCache(ttl=0.01)
+    await cache.set('search:a', [1])
+    await asyncio.sleep(0.02)
+    assert await cache.get('search:a') is None
+    assert len(cache) == 0
+
+
+async def test_in_memory_cache_invalidate():
+    cache = InMemorySearchCache()
+    await cache.set('search:a', [1])
+    await cache.set('another_search:a', [2])
+
+    await cache.invalidate('search')
+    assert await cache.get('search:a') is None
+    assert await cache.get('another_search:a') == [2]
+
+
+async def test_full_search_cache(seed_database: None, session: AsyncSession, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(full_search, 'cache', InMemorySearchCache())
+    key = full_search.cache_key('Misha', limit=10)
+    assert key == full_search.cache_key('  misha ', limit=10)
+
+    result = await full_search.fetch(session, 'Misha', limit=10)
+    assert result
+    assert await full_search.cache.get(key) == result
+
+    await full_search.refresh(session)
+    # concurrent searches still see the old view until commit
+    assert await full_search.cache.get(key) == result
+
+    await session.commit()
+    assert await full_search.cache.get(key) is None
@@ -0,0 +1,43 @@
+"""
+Test search executor routing reads to search engine.
+"""
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from models import full_search
+from models.models import articles_search
+from services.executor import SearchExecutor
+from settings import Settings
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_search_executor(seed_database: None, search_engine: AsyncEngine, settings: Settings):
+    executor = SearchExecutor(search_engine)
+
+    rows = await executor.fetch(articles_search, 'Imagine', limit=10)
+    assert rows[0].title == 'Imagine'
+
+    rows = await executor.execute(articles_search, articles_search('Imagine', include_similarity_ratio=True))
+    assert rows[0].title == 'Imagine'
+
+    grouped = await executor.search_many(full_search, ['Imagine'])
+    assert grouped['Imagine'][0].title == 'Imagine'
+
+    chunks = [chunk async for chunk in executor.stream(articles_search, 'Imagine', chunk_size=1)]
+    assert all(len(chunk) == 1 for chunk in chunks)
+
+    async with search_engine.connect() as connection:
+        timeout = await connection.execute(text("SELECT setting FROM pg_settings WHERE name = 'statement_timeout'"))
+        assert timeout.scalar() == str(settings.SEARCH_STATEMENT_TIMEOUT)
+        assert (await connection.execute(text('SHOW work_mem'))).scalar() == settings.SEARCH_WORK_MEM
+
+
+async def test_search_executor_read_only(seed_database: None, search_engine: AsyncEngine):
+    executor = SearchExecutor(search_engine)
+
+    with pytest.raises(DBAPIError, match='read-only transaction'):
+        await executor.execute(articles_search, text('DELETE FROM articles'))
@@ -0,0 +1,66 @@
+"""
+Test federated search across shards with merged top matches.
+"""
+
+import pytest
+from sqlalchemy import Row, func, select
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+from models import full_search
+from models.models import articles_search
+from services.cache import InMemorySearchCache
+from services.federated import FederatedSearchService, Shard
+from services.search_service import FuzzySearchService, SearchMode
+
+pytestmark = pytest.mark.anyio
+
+
+class SlowSearchService(FuzzySearchService):
+    async def fetch(
+        self,
+        session: AsyncSession,
+        term: str,
+        *,
+        limit: int | None = None,
+        knn: bool = False,
+        mode: SearchMode | None = None,
+    ) -> list[Row]:
+        await session.execute(select(func.pg_sleep(1)))
+        return await super().fetch(session, term, limit=limit, knn=knn, mode=mode)
+
+
+async def test_federated_search(seed_database: None, engine: AsyncEngine):
+    search = FederatedSearchService([Shard('articles', engine, articles_search), Shard('full', engine, full_search)])
+
+    result = await search.search('Imagine', limit=3)
+    assert not result.partial
+    assert 2 <= len(result.matches) <= 3
+    assert {match.shard for match in result.matches[:2]} == {'articles', 'full'}
+    assert all(match.row.title == 'Imagine' for match in result.matches[:2])
+    ratios = [match.similarity_ratio for match in result.matches]
+    assert ratios == sorted(ratios, reverse=True)
+
+
+async def test_federated_search_bypasses_cache(seed_database: None, engine: AsyncEngine):
+    cache = InMemorySearchCache()
+    cached_search = FuzzySearchService(*articles_search.columns, similarity_limit=0.01, cache=cache)
+    # stale rows of another database
+    await cache.set(cached_search.cache_key('Imagine', limit=3), [])
+    search = FederatedSearchService([Shard('eu', engine, cached_search), Shard('us', engine, cached_search)])
+
+    result = await search.search('Imagine', limit=3)
+    assert {match.shard for match in result.matches[:2]} == {'eu', 'us'}
+    assert cached_search.cache is cache
+    assert len(cache) == 1
+
+
+async def test_federated_search_timeout(seed_database: None, engine: AsyncEngine):
+    slow_search = SlowSearchService(*articles_search.columns, similarity_limit=0.01)
+    search = FederatedSearchService(
+        [Shard('articles', engine, articles_search), Shard('slow', engine, slow_search)], timeout=0.5
+    )
+
+    result = await search.search('Imagine', limit=10)
+    assert result.partial
+    assert isinstance(result.failed['slow'], TimeoutError)
+    assert result.matches and all(match.shard == 'articles' for match in result.matches)
@@ -2,12 +2,16 @@
 Test full text search on Authors and Articles by MaterializedSearchService.
 """
 
+import csv
+import io
+import json
 from pprint import pprint
+
 import pytest
 from sqlalchemy.ext.asyncio import AsyncSession
 
-
-from models import full_search
+from models import ArticleModel, AuthorModel, full_search
+from services.export import write_csv, write_jsonl
 
 pytestmark = pytest.mark.anyio
 
@@ -34,3 +38,58 @@ async def test_full_search(seed_database: None, session: AsyncSession):
     result = (await session.execute(full_search('Full Text Search', include_similarity_ratio=True))).all()
     assert result
     pprint(result)
+
+
+async def test_full_search_concurrent_refresh(seed_database: None, session: AsyncSession):
+    await full_search.set_similarity_limit(session)
+    await full_search.refresh(session, concurrently=True)
+
+    result = (await session.execute(full_search('vybornyy', include_similarity_ratio=True, limit=100))).all()
+    assert len(result) == 4
+    assert all(row.authors_id for row in result)
+
+    pages = []
+    cursor = None
+    while page := (
+        await session.execute(full_search('vybornyy', include_similarity_ratio=True, limit=1, after=cursor))
+    ).all():
+        pages.extend(page)
+        cursor = full_search.cursor(page[-1])
+
+    assert pages == result
+
+
+async def test_full_search_hits(seed_database: None, session: AsyncSession):
+    hits = await full_search.search(session, 'vybornyy', limit=10, load=[AuthorModel, ArticleModel])
+    assert len(hits) == 4
+    assert [hit.score for hit in hits] == sorted((hit.score for hit in hits), reverse=True)
+
+    for hit in hits:
+        author, article = hit.entities
+        assert isinstance(author, AuthorModel) and author.id == hit.keys['authors_id']
+        assert author.username == hit.fields['username']
+        if hit.keys['articles_id'] is None:
+            assert article is None
+        else:
+            assert isinstance(article, ArticleModel) and article.title == hit.fields['title']
+
+
+async def test_full_search_stream(seed_database: None, session: AsyncSession):
+    await full_search.set_similarity_limit(session)
+    result = (await session.execute(full_search('vybornyy', include_similarity_ratio=True))).all()
+
+    chunks = [chunk async for chunk in full_search.stream(session, 'vybornyy', chunk_size=3)]
+    assert [len(chunk) for chunk in chunks] == [3, 1]
+    assert {row for chunk in chunks for row in chunk} == set(result)
+
+
+async def test_full_search_export(seed_database: None, session: AsyncSession):
+    csv_file, jsonl_file = io.StringIO(), io.StringIO()
+    assert await write_csv(full_search.stream(session, 'vybornyy', chunk_size=3), csv_file) == 4
+    assert await write_jsonl(full_search.stream(session, 'vybornyy', chunk_size=3), jsonl_file) == 4
+
+    csv_rows = list(csv.DictReader(io.StringIO(csv_file.getvalue())))
+    json_rows = [json.loads(line) for line in jsonl_file.getvalue().splitlines()]
+    assert len(csv_rows) == len(json_rows) == 4
+    assert sorted(row['username'] for row in csv_rows) == sorted(row['username'] for row in json_rows)
+    assert all('similarity_ratio' in row for row in json_rows)
@@ -0,0 +1,99 @@
+"""
+Test full text search on Authors and Articles by IncrementalSearchService.
+"""
+
+import asyncio
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+from models.models import ArticleModel, AuthorModel, incremental_full_search
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_incremental_search_sync_on_insert(seed_database: None, session: AsyncSession):
+    await incremental_full_search.set_similarity_limit(session)
+
+    result = (await session.execute(incremental_full_search('Misha', include_similarity_ratio=True))).all()
+    assert len(result) == 3
+
+    rows = (await session.execute(select(func.count()).select_from(incremental_full_search.table))).scalar()
+    assert rows == 4  # 3 articles of the first author and the second author without articles
+
+
+async def test_incremental_search_sync_on_update_and_delete(seed_database: None, session: AsyncSession):
+    await incremental_full_search.set_similarity_limit(session)
+    search_table = incremental_full_search.table
+    author = (
+        await session.execute(select(AuthorModel).where(AuthorModel.username == 'vybornyy (no articles)'))
+    ).scalar()
+
+    async def author_search_rows():
+        statement = select(search_table.c.title).where(search_table.c.authors_id == author.id)
+        return (await session.execute(statement)).scalars().all()
+
+    assert await author_search_rows() == [None]
+
+    article = ArticleModel(title='Yesterday', body='All my troubles seemed so far away. ')
+    article.author = author
+    session.add(article)
+    await session.flush()
+    assert await author_search_rows() == ['Yesterday']
+
+    result = (await session.execute(incremental_full_search('Yesterday', mode='word_similarity'))).all()
+    assert [(row.username, row.title) for row in result] == [('vybornyy (no articles)', 'Yesterday')]
+
+    article.title = 'Yellow Submarine'
+    await session.flush()
+    assert await author_search_rows() == ['Yellow Submarine']
+    assert not (await session.execute(incremental_full_search('Yesterday', mode='word_similarity'))).all()
+
+    await session.delete(article)
+    await session.flush()
+    assert await author_search_rows() == [None]
+
+
+async def test_incremental_search_hits(seed_database: None, session: AsyncSession):
+    hits = await incremental_full_search.search(session, 'vybornyy', limit=10, load=[AuthorModel, ArticleModel])
+    assert len(hits) == 4
+
+    for hit in hits:
+        assert set(hit.keys) == {'authors_id', 'articles_id'}
+        author, article = hit.entities
+        assert isinstance(author, AuthorModel) and author.id == hit.keys['authors_id']
+        if hit.keys['articles_id'] is None:
+            assert article is None
+        else:
+            assert isinstance(article, ArticleModel) and article.id == hit.keys['articles_id']
+
+    with pytest.raises(ValueError):
+        incremental_full_search.source_key(incremental_full_search.table)
+
+
+async def test_incremental_search_concurrent_inserts(seed_database: None, engine: AsyncEngine):
+    search_table = incremental_full_search.table
+    async with AsyncSession(engine) as session:
+        author_id = (
+            await session.execute(select(AuthorModel.id).where(AuthorModel.username == 'vybornyy 1'))
+        ).scalar_one()
+
+    async with AsyncSession(engine) as first, AsyncSession(engine) as second:
+        for session, title in ((first, 'Yesterday'), (second, 'Let It Be')):
+            article = ArticleModel(title=title, body=None)
+            article.author_id = author_id
+            session.add(article)
+
+        await first.flush()
+        # rewrite of the same author rows waits for the first transaction
+        second_flush = asyncio.create_task(second.flush())
+        await asyncio.sleep(0.5)
+        assert not second_flush.done()
+        await first.commit()
+        await second_flush
+        await second.commit()
+
+    async with AsyncSession(engine) as session:
+        statement = select(func.count()).select_from(search_table).where(search_table.c.authors_id == author_id)
+        assert (await session.execute(statement)).scalar() == 5  # 3 seeded and 2 inserted articles
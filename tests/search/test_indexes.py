@@ -0,0 +1,79 @@
+"""
+Test online search indexes lifecycle: concurrent creation, rebuild and validity checks.
+"""
+
+import pytest
+from sqlalchemy import Column, Integer, MetaData, Table, Text, text
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+from models.base import Base
+from models.models import articles_search
+from services.ddl import CreateIndexConcurrently, DropIndexConcurrently, RenameIndex
+from services.indexes import index_name
+from services.search_service import FuzzySearchService
+
+pytestmark = pytest.mark.anyio
+
+
+def compile_ddl(element) -> str:
+    return str(element.compile(dialect=postgresql.dialect()))
+
+
+def test_create_index_concurrently_ddl():
+    assert articles_search.index is not None
+    name = articles_search.index.name
+    indexes = set(articles_search.index.table.indexes)
+
+    ddl = compile_ddl(CreateIndexConcurrently(articles_search.index, name='tmp_idx', if_not_exists=True))
+    assert ddl.startswith('CREATE INDEX CONCURRENTLY IF NOT EXISTS tmp_idx ON articles USING gin')
+    assert 'gin_trgm_ops' in ddl
+
+    # index itself is not changed
+    assert articles_search.index.name == name
+    assert articles_search.index.dialect_options['postgresql']['concurrently'] is False
+    assert articles_search.index.table.indexes == indexes
+
+
+def test_drop_and_rename_index_ddl():
+    assert compile_ddl(DropIndexConcurrently('idx')) == 'DROP INDEX CONCURRENTLY IF EXISTS idx'
+    assert compile_ddl(RenameIndex('idx__rebuild', 'idx')) == 'ALTER INDEX idx__rebuild RENAME TO idx'
+
+
+def test_weighted_index_names():
+    metadata = MetaData(naming_convention=Base.metadata.naming_convention)
+    table = Table(
+        'songs', metadata, Column('id', Integer, primary_key=True), Column('title', Text), Column('lyrics', Text)
+    )
+    concat_search = FuzzySearchService(table.c.title, table.c.lyrics, init_index=True)
+    weighted_search = FuzzySearchService(table.c.title, table.c.lyrics, weights=(1.0, 0.3), init_index=True)
+
+    names = [index_name(index) for index in concat_search.indexes + weighted_search.indexes]
+    assert names == ['ix__songs__title', 'songs_title_trgm_idx', 'songs_lyrics_trgm_idx']
+
+
+async def test_create_and_rebuild_indexes(seed_database: None, engine: AsyncEngine):
+    assert articles_search.index is not None
+    name = articles_search.index.name
+
+    async with engine.connect() as connection:
+        connection = await connection.execution_options(isolation_level='AUTOCOMMIT')
+        await connection.execute(DropIndexConcurrently(name))
+    assert await articles_search.invalid_indexes(engine) == [name]
+
+    await articles_search.create_indexes(engine)
+    assert await articles_search.invalid_indexes(engine) == []
+
+    await articles_search.rebuild_indexes(engine)
+    assert await articles_search.invalid_indexes(engine) == []
+
+    async with AsyncSession(engine) as session, session.begin():
+        indexes = set(
+            (await session.execute(text("SELECT indexname FROM pg_indexes WHERE tablename = 'articles'"))).scalars()
+        )
+        assert name in indexes
+        assert f'{name}__rebuild' not in indexes
+
+        await articles_search.set_similarity_limit(session)
+        result = (await session.execute(articles_search('Imagine'))).all()
+    assert 'Imagine' in [row.title for row in result]
@@ -0,0 +1,46 @@
+"""
+Test background refresh of MaterializedSearchService view.
+"""
+
+import asyncio
+
+import pytest
+from sqlalchemy import Column, MetaData, Table, Text, select
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+from models import full_search
+from models.models import ArticleModel, AuthorModel
+from services.refresher import BackgroundRefresher
+from services.search_service import MaterializedSearchService
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_background_refresher(seed_database: None, engine: AsyncEngine):
+    async with BackgroundRefresher(full_search, engine, debounce=0.5, max_staleness=5) as refresher:
+        for title in ('Yesterday', 'Yellow Submarine', 'Let It Be'):
+            async with AsyncSession(engine) as session, session.begin():
+                author = (await session.execute(select(AuthorModel).limit(1))).scalar_one()
+                article = ArticleModel(title=title, body=None)
+                article.author = author
+                session.add(article)
+
+        assert refresher.staleness > 0
+
+        while refresher.staleness:
+            await asyncio.sleep(0.1)
+
+    assert refresher.refresh_count == 1
+    async with AsyncSession(engine) as session, session.begin():
+        await full_search.set_similarity_limit(session)
+        result = (await session.execute(full_search('Yellow Submarine', mode='word_similarity'))).all()
+        assert [row.title for row in result] == ['Yellow Submarine']
+
+
+def test_background_refresher_concurrently_requires_key_index(engine: AsyncEngine):
+    view = Table('songs_view', MetaData(), Column('title', Text))
+    service = MaterializedSearchService(view)
+
+    with pytest.raises(ValueError):
+        BackgroundRefresher(service, engine)
+    assert not BackgroundRefresher(service, engine, concurrently=False).concurrently
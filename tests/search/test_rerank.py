@@ -0,0 +1,45 @@
+"""
+Test vectorized re-rank of search results.
+"""
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from models.models import ArticleModel, articles_search
+from services import trigram
+
+np = pytest.importorskip('numpy')
+
+from services.rerank import VectorizedScorer, rerank  # noqa: E402
+
+pytestmark = pytest.mark.anyio
+
+TEXTS = ['two words', 'word', '', 'Full Text Search in PostgreSQL by SQLAlchemy', 'sword words']
+
+
+@pytest.mark.parametrize('mode', ['similarity', 'word_similarity', 'strict_word_similarity'])
+async def test_vectorized_scorer_same_as_trigram(mode: str):
+    function = getattr(trigram, mode)
+    scorer = VectorizedScorer(TEXTS)
+
+    for term in ('word', 'SQL', 'zzz', ''):
+        scores = scorer.score(term, mode)
+        assert scores.dtype == np.float32
+        assert scores.tolist() == pytest.approx([function(term, text) for text in TEXTS])
+
+
+async def test_vectorized_scorer_threshold():
+    scores = VectorizedScorer(TEXTS).word_similarity('words', threshold=0.9)
+    assert scores.tolist() == [1.0, 0.0, 0.0, 0.0, 1.0]
+
+
+async def test_rerank(seed_database: None, session: AsyncSession):
+    await articles_search.set_similarity_limit(session)
+    rows = (await session.execute(articles_search('Imagine people', include_similarity_ratio=True))).all()
+
+    reranked = rerank(rows, 'Imagine people', ArticleModel.title, ArticleModel.body)
+    expected = sorted(rows, key=lambda row: row.similarity_ratio, reverse=True)
+    assert [(row.id, score) for row, score in reranked] == [(row.id, row.similarity_ratio) for row in expected]
+
+    weighted = rerank(rows, 'Imagine', ArticleModel.title, ArticleModel.body, weights=(1.0, 0.0), limit=1)
+    assert [(row.title, score) for row, score in weighted] == [('Imagine', 1.0)]
@@ -0,0 +1,37 @@
+"""
+Test query terms normalization and routing.
+"""
+
+import pytest
+
+from services.terms import RoutedTerm, TermPolicy, normalize_term
+
+
+@pytest.mark.parametrize(
+    'term, expected',
+    [
+        ('  Full-Text   SEARCH!!! ', 'full text search'),
+        ('STRAßE', 'straße'),
+        ('snake_case', 'snake case'),
+        ('???', ''),
+    ],
+)
+def test_normalize_term(term: str, expected: str):
+    assert normalize_term(term) == expected
+
+
+def test_normalize_term_max_length():
+    assert normalize_term('Hello, wonderful world', max_length=12) == 'hello'
+    assert normalize_term('Hello, wonderful world', max_length=15) == 'hello wonderful'
+    assert normalize_term('abcdefgh', max_length=3) == 'abc'
+
+
+def test_term_policy_route():
+    policy = TermPolicy(prefix_length=2, word_length=10, max_length=20)
+
+    assert policy.route('A!', 'similarity') == RoutedTerm('a', 'similarity', prefix=True)
+    assert policy.route('Imagine', 'similarity') == RoutedTerm('imagine', 'similarity')
+    assert policy.route('imagine all the people', 'similarity') == RoutedTerm('imagine all the', 'word_similarity')
+    assert policy.route('imagine all the people', 'strict_word_similarity').mode == 'strict_word_similarity'
+    # nothing is left to search by prefix
+    assert policy.route('!!', 'similarity') == RoutedTerm('', 'similarity')
@@ -0,0 +1,82 @@
+"""
+Test in-process trigram search by InMemorySearchService.
+"""
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from models.models import ArticleModel, AuthorModel, articles_search
+from services import trigram
+from services.trigram import InMemorySearchService
+from tests.search.documents import documents
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.mark.parametrize(
+    'function, expected',
+    [
+        # examples of `pg_trgm` docs
+        (trigram.similarity, 0.36363637),
+        (trigram.word_similarity, 0.8),
+        (trigram.strict_word_similarity, 0.5714286),
+    ],
+)
+async def test_trigram_functions(function, expected: float):
+    assert function('word', 'two words') == pytest.approx(expected)
+
+
+async def test_trigrams():
+    assert trigram.trigrams('cat') == {'  c', ' ca', 'cat', 'at '}
+    assert trigram.trigrams('Foo, bar!') == {'  f', ' fo', 'foo', 'oo ', '  b', ' ba', 'bar', 'ar '}
+    assert trigram.similarity('', 'word') == 0.0
+
+
+async def test_in_memory_search():
+    authors_search = InMemorySearchService(AuthorModel.username, similarity_limit=0.1)
+    authors_search.build(
+        [
+            AuthorModel(username='vybornyy', first_name=None, last_name=None),
+            AuthorModel(username='vybornyy 2', first_name=None, last_name=None),
+            AuthorModel(username='someone else', first_name=None, last_name=None),
+        ]
+    )
+    assert len(authors_search) == 3
+
+    result = authors_search('vybornyy', include_similarity_ratio=True)
+    assert [row.username for row in result] == ['vybornyy', 'vybornyy 2']
+    assert result[0].similarity_ratio == 1.0
+
+    pages = []
+    cursor = None
+    while page := authors_search('vybornyy', include_similarity_ratio=True, limit=1, after=cursor):
+        pages.extend(page)
+        cursor = authors_search.cursor(page[-1])
+    assert pages == result
+
+
+async def test_in_memory_search_same_as_database(seed_database: None, session: AsyncSession):
+    in_memory_search = InMemorySearchService(ArticleModel.title, ArticleModel.body, similarity_limit=0.01)
+    await in_memory_search.load(session)
+    await articles_search.set_similarity_limit(session)
+
+    for mode in ('similarity', 'word_similarity'):
+        expected = (
+            await session.execute(
+                articles_search('Full Text Search', mode=mode, include_similarity_ratio=True, limit=10)
+            )
+        ).all()
+        result = in_memory_search('Full Text Search', mode=mode, include_similarity_ratio=True, limit=10)
+        assert [(row.id, row.similarity_ratio) for row in result] == [
+            (row.id, row.similarity_ratio) for row in expected
+        ]
+
+
+async def test_in_memory_search_generated_columns(seed_documents: None, session: AsyncSession):
+    in_memory_search = InMemorySearchService(documents.c.title, documents.c.body, similarity_limit=0.01)
+    await in_memory_search.load(session)
+    assert len(in_memory_search) == 3
+
+    result = in_memory_search('Imagine', include_similarity_ratio=True, limit=1)
+    assert [row.title for row in result] == ['Imagine']
+    assert result[0]._fields == ('id', 'title', 'body', 'author_id', 'similarity_ratio')
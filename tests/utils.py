@@ -1,10 +1,10 @@
 from typing import Any
 
-from sqlalchemy import Select, text
+from sqlalchemy import text
 from sqlalchemy.engine import URL, make_url
 from sqlalchemy.ext.asyncio import create_async_engine
-from sqlalchemy.ext.compiler import compiles
-from sqlalchemy.sql.expression import ClauseElement, Executable
+
+from services.explain import explain  # noqa: F401
 
 
 def quote(clause: Any):
@@ -49,26 +49,3 @@ async def async_drop_database(url: URL | str):
         # Drop the database.
         sql = f'DROP DATABASE {quote(url.database)}'
         await conn.execute(text(sql))
-
-
-class explain(Executable, ClauseElement):  # noqa N801
-    """
-    Get Postgres query plan for debug and test porpoises.
-    Docs: https://github.com/sqlalchemy/sqlalchemy/wiki/Query-Plan-SQL-construct
-    """
-
-    inherit_cache = True
-
-    def __init__(self, statement: Select, analyze: bool = False):
-        self.statement = statement
-        self.analyze = analyze
-
-
-@compiles(explain, "postgresql")
-def pg_explain(element, compiler, **kw):
-    text = "EXPLAIN "
-    if element.analyze:
-        text += "ANALYZE "
-    text += compiler.process(element.statement, **kw)
-
-    return text